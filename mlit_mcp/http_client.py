@@ -7,6 +7,7 @@ from typing import Any, Mapping
 from collections import Counter
 import logging
 
+import anyio
 import httpx
 from tenacity import (
     AsyncRetrying,
@@ -15,11 +16,20 @@ from tenacity import (
     wait_exponential,
 )
 
+from . import json_codec
 from .cache import BinaryFileCache, InMemoryTTLCache
 from .settings import get_settings
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without h2
+    HTTP2_AVAILABLE = False
+
 
 RETRYABLE_STATUS_CODES = {408, 409, 425, 429} | set(range(500, 600))
+KEEPALIVE_EXPIRY_SECONDS = 30.0
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +39,8 @@ class FetchResult:
     data: Any | None = None
     file_path: Path | None = None
     from_cache: bool = False
+    # Size of the raw response body, when known (i.e. on a cache miss)
+    size_bytes: int | None = None
 
 
 class RetryableHTTPStatusError(Exception):
@@ -49,6 +61,7 @@ class MLITHttpClient:
         api_key: str | None = None,
         timeout: float | None = None,
         max_attempts: int = 4,
+        max_concurrency: int | None = None,
         transport: Any = None,
     ) -> None:
         settings = get_settings()
@@ -57,14 +70,33 @@ class MLITHttpClient:
         self._json_cache = json_cache
         self._file_cache = file_cache
         self._max_attempts = max_attempts
+        self._max_concurrency = max_concurrency or settings.max_concurrency
+        # Shared across every tool using this client so fan-out via
+        # asyncio.gather cannot flood the MLIT API. anyio keeps the client
+        # usable under any async backend httpx supports.
+        self._semaphore = anyio.Semaphore(self._max_concurrency)
+        # One pooled AsyncClient serves every tool. Keep as many idle
+        # connections as may be in flight, and keep them long enough for
+        # follow-up calls to skip the TLS handshake. With h2 installed,
+        # concurrent requests are multiplexed over a single HTTP/2 connection.
         self._client = httpx.AsyncClient(
             base_url=base_url,
             timeout=timeout or settings.http_timeout,
             headers={"Ocp-Apim-Subscription-Key": self._api_key},
+            limits=httpx.Limits(
+                max_keepalive_connections=self._max_concurrency,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=HTTP2_AVAILABLE,
             transport=transport,
         )
         self._stats: Counter[str] = Counter()
 
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of in-flight upstream requests."""
+        return self._max_concurrency
+
     def get_stats(self) -> dict[str, int]:
         """Return a dictionary of collected statistics."""
         return {
@@ -88,7 +120,17 @@ class MLITHttpClient:
         params: Mapping[str, Any] | None = None,
         response_format: str = "json",
         force_refresh: bool = False,
+        parse: bool = False,
     ) -> FetchResult:
+        """Fetch an endpoint through the cache.
+
+        JSON responses are returned as ``data``; other formats are written to
+        the file cache and returned as ``file_path``. With ``parse=True`` a
+        freshly downloaded GeoJSON body is also parsed from the in-memory
+        response into ``data`` on a worker thread, so callers need not read
+        back the file that was just written. Cache hits still return only the
+        path.
+        """
         cache_key = self._build_cache_key(endpoint, params, response_format)
         normalized_format = response_format.lower()
 
@@ -109,20 +151,31 @@ class MLITHttpClient:
 
         self._stats["cache_misses"] += 1
         try:
-            response = await self._send_with_retry(endpoint, params)
+            async with self._semaphore:
+                response = await self._send_with_retry(endpoint, params)
         except Exception as e:
             self._stats["api_errors"] += 1
             logger.error(f"Request failed for {endpoint}: {e}")
             raise
 
+        content = response.content
         if normalized_format == "json":
-            data = response.json()
+            # json_codec parses the raw body with orjson when it is installed,
+            # which is several times faster than httpx's stdlib-based json()
+            data = json_codec.loads(content)
             self._json_cache.set(cache_key, data)
-            return FetchResult(data=data, from_cache=False)
+            return FetchResult(data=data, from_cache=False, size_bytes=len(content))
 
         suffix = self._suffix_for_format(normalized_format)
-        path = self._file_cache.set(cache_key, response.content, suffix=suffix)
-        return FetchResult(file_path=path, from_cache=False)
+        path = self._file_cache.set(cache_key, content, suffix=suffix)
+        data = None
+        if parse and normalized_format == "geojson":
+            # Tiles can be large; parse them on a worker thread so a cache
+            # miss does not stall the event loop
+            data = await json_codec.run_parser(json_codec.loads, content)
+        return FetchResult(
+            data=data, file_path=path, from_cache=False, size_bytes=len(content)
+        )
 
     def _get_cached(self, normalized_format: str, cache_key: str) -> Any | None:
         if normalized_format == "json":
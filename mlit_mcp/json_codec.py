@@ -0,0 +1,79 @@
+"""JSON encode/decode helpers backed by orjson/ijson when they are installed."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+import anyio
+from anyio.lowlevel import RunVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Files at or below this size are parsed whole with orjson, which is
+# considerably faster than streaming them through ijson
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+
+# Worker-thread capacity reserved for parsing, created per event loop
+_PARSE_LIMITER: RunVar[anyio.CapacityLimiter] = RunVar("mlit_parse_limiter")
+
+
+def loads(content: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(content)
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_features(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the features of a GeoJSON FeatureCollection file one at a time.
+
+    Files up to ``STREAM_MIN_BYTES`` are parsed whole with the fast codec.
+    Larger files, or any file when orjson is missing, are streamed with ijson
+    when it is installed, so memory stays bounded by a single feature.
+    """
+    if ijson is not None and (orjson is None or path.stat().st_size > STREAM_MIN_BYTES):
+        with open(path, "rb") as fh:
+            yield from ijson.items(fh, "features.item", use_float=True)
+        return
+    data = loads(path.read_bytes()) or {}
+    yield from data.get("features", [])
+
+
+async def run_parser(func: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound parse job on a worker thread.
+
+    Parse jobs share a limiter sized to the CPU count instead of anyio's
+    default thread pool, so concurrent tool calls cannot crowd out the
+    short file-system calls that also run on worker threads.
+    """
+    try:
+        limiter = _PARSE_LIMITER.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+        _PARSE_LIMITER.set(limiter)
+    return await anyio.to_thread.run_sync(func, *args, limiter=limiter)
+
+
+__all__ = ["dumps", "iter_features", "loads", "run_parser"]
@@ -210,6 +210,7 @@ async def fetch_urban_planning_zones(
     y: int,
     response_format: str = "geojson",
     force_refresh: bool = False,
+    prefetch_neighbors: bool = False,
 ) -> dict:
     """
     Fetch urban planning zone (都市計画区域) data from MLIT dataset XKT001.
@@ -221,6 +222,8 @@ async def fetch_urban_planning_zones(
         y: Tile Y coordinate
         response_format: 'geojson' or 'pbf', defaults to 'geojson'
         force_refresh: If true, bypass cache and fetch fresh data
+        prefetch_neighbors: If true, fetch the 8 surrounding tiles into the
+            cache in the background so adjacent lookups are served from it
     """
     from .tools.fetch_urban_planning_zones import (
         FetchUrbanPlanningZonesInput,
@@ -234,6 +237,7 @@ async def fetch_urban_planning_zones(
         y=y,
         responseFormat=cast(Literal["geojson", "pbf"], response_format),
         forceRefresh=force_refresh,
+        prefetchNeighbors=prefetch_neighbors,
     )
     result = await tool.run(input_data)
     return result.model_dump(by_alias=True, exclude_none=True)
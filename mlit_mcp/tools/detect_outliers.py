@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from enum import Enum
-from statistics import mean, stdev, quantiles
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from mlit_mcp.http_client import MLITHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of outlier records returned in a response
+MAX_OUTLIERS = 100
+
 
 class OutlierMethod(str, Enum):
     """Method for outlier detection."""
@@ -147,17 +151,25 @@ class DetectOutliersTool:
         if payload.classification:
             params_base["priceClassification"] = payload.classification
 
-        for year in range(payload.from_year, payload.to_year + 1):
-            params = params_base.copy()
-            params["year"] = str(year)
+        year_params = [
+            {**params_base, "year": str(year)}
+            for year in range(payload.from_year, payload.to_year + 1)
+        ]
 
-            fetch_result = await self._http_client.fetch(
-                "XIT001",
-                params=params,
-                response_format="json",
-                force_refresh=payload.force_refresh,
+        # Years are fetched concurrently; the shared http client bounds fan-out
+        fetch_results = await asyncio.gather(
+            *(
+                self._http_client.fetch(
+                    "XIT001",
+                    params=params,
+                    response_format="json",
+                    force_refresh=payload.force_refresh,
+                )
+                for params in year_params
             )
+        )
 
+        for fetch_result in fetch_results:
             year_data = fetch_result.data
             if isinstance(year_data, dict):
                 if "data" in year_data and isinstance(year_data["data"], list):
@@ -165,18 +177,24 @@ class DetectOutliersTool:
             elif isinstance(year_data, list):
                 all_data.extend(year_data)
 
-        # Extract prices with metadata
-        records: list[tuple[int, dict]] = []
+        # Extract prices into a packed array alongside the source records.
+        # Prices above the int32 range are common, so use int64 throughout and
+        # skip the rare value that does not fit even that.
+        prices_np = np.empty(len(all_data), dtype=np.int64)
+        raw_records: list[dict] = []
+        k = 0
         for record in all_data:
             price_str = record.get("TradePrice")
             if price_str:
                 try:
-                    price = int(price_str)
-                    records.append((price, record))
-                except (ValueError, TypeError):
-                    pass
-
-        if not records:
+                    prices_np[k] = int(price_str)
+                except (ValueError, TypeError, OverflowError):
+                    continue
+                raw_records.append(record)
+                k += 1
+        prices_np = prices_np[:k]
+
+        if k == 0:
             return DetectOutliersResponse(
                 totalCount=0,
                 outlierCount=0,
@@ -185,58 +203,50 @@ class DetectOutliersTool:
                 threshold=payload.threshold,
             )
 
-        prices = [r[0] for r in records]
-        total_count = len(prices)
-        avg_before = int(mean(prices))
+        total_count = k
+        avg_before = int(prices_np.mean())
 
         # Detect outliers based on method
-        outlier_indices = set()
+        mask = np.zeros(k, dtype=bool)
 
         if payload.method == OutlierMethod.IQR:
-            if len(prices) >= 4:
-                q = quantiles(prices, n=4)
-                q1, q3 = q[0], q[2]
+            if k >= 4:
+                # "weibull" matches statistics.quantiles' default exclusive method
+                q1, q3 = np.percentile(prices_np, [25, 75], method="weibull")
                 iqr = q3 - q1
                 lower_bound = q1 - payload.threshold * iqr
                 upper_bound = q3 + payload.threshold * iqr
-
-                for i, price in enumerate(prices):
-                    if price < lower_bound or price > upper_bound:
-                        outlier_indices.add(i)
+                mask = (prices_np < lower_bound) | (prices_np > upper_bound)
 
         elif payload.method == OutlierMethod.ZSCORE:
-            if len(prices) >= 2:
-                avg = mean(prices)
-                std = stdev(prices)
+            if k >= 2:
+                avg = prices_np.mean()
+                std = prices_np.std(ddof=1)
                 if std > 0:
-                    for i, price in enumerate(prices):
-                        z = abs((price - avg) / std)
-                        if z > payload.threshold:
-                            outlier_indices.add(i)
+                    mask = np.abs((prices_np - avg) / std) > payload.threshold
+
+        # Counts and exclusion stats reduce over the full mask; only the first
+        # MAX_OUTLIERS indices (already in ascending order) become records.
+        outlier_count = int(np.count_nonzero(mask))
+        reason = f"Detected by {payload.method.value} (threshold={payload.threshold})"
 
-        # Build outlier records
+        # Build outlier records. Values come from our own int parsing and raw
+        # record lookups, so validation is skipped via model_construct.
         outliers: list[OutlierRecord] = []
-        for i in sorted(outlier_indices):
-            price, record = records[i]
-            reason = (
-                f"Detected by {payload.method.value} (threshold={payload.threshold})"
-            )
+        for i in np.flatnonzero(mask)[:MAX_OUTLIERS]:
+            record = raw_records[i]
             outliers.append(
-                OutlierRecord(
-                    price=price,
+                OutlierRecord.model_construct(
+                    price=int(prices_np[i]),
                     type=record.get("Type"),
                     period=record.get("Period"),
                     reason=reason,
                 )
             )
-            if len(outliers) >= 100:  # Limit output size
-                break
 
         # Calculate stats after exclusion
-        non_outlier_prices = [
-            prices[i] for i in range(len(prices)) if i not in outlier_indices
-        ]
-        avg_after = int(mean(non_outlier_prices)) if non_outlier_prices else None
+        non_outlier_prices = prices_np[~mask]
+        avg_after = int(non_outlier_prices.mean()) if non_outlier_prices.size else None
 
         logger.info(
             "detect_outliers",
@@ -246,16 +256,16 @@ class DetectOutliersTool:
                 "area": payload.area,
                 "method": payload.method.value,
                 "total_count": total_count,
-                "outlier_count": len(outlier_indices),
+                "outlier_count": outlier_count,
             },
         )
 
-        return DetectOutliersResponse(
-            totalCount=total_count,
-            outlierCount=len(outlier_indices),
+        return DetectOutliersResponse.model_construct(
+            total_count=total_count,
+            outlier_count=outlier_count,
             outliers=outliers,
-            avgBeforeExclusion=avg_before,
-            avgAfterExclusion=avg_after,
+            avg_before_exclusion=avg_before,
+            avg_after_exclusion=avg_after,
             method=payload.method.value,
             threshold=payload.threshold,
         )
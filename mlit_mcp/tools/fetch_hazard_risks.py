@@ -20,11 +20,13 @@ class HazardType(str, Enum):
 
     @property
     def dataset_id(self) -> str:
-        if self == HazardType.FLOOD:
-            return "XKT026"
-        elif self == HazardType.LANDSLIDE:
-            return "XKT029"
-        return ""
+        return _HAZARD_DATASET_IDS.get(self, "")
+
+
+_HAZARD_DATASET_IDS: dict[HazardType, str] = {
+    HazardType.FLOOD: "XKT026",
+    HazardType.LANDSLIDE: "XKT029",
+}
 
 
 class FetchHazardRisksInput(BaseModel):
@@ -26,15 +26,15 @@ class AmenityType(str, Enum):
     @property
     def dataset_id(self) -> str:
         """Return the MLIT dataset ID for this amenity type."""
-        if self == AmenityType.SCHOOL:
-            return "XKT008"  # 学校
-        elif self == AmenityType.NURSERY:
-            return "XKT009"  # 保育園・幼稚園
-        elif self == AmenityType.MEDICAL:
-            return "XKT010"  # 医療機関
-        elif self == AmenityType.WELFARE:
-            return "XKT011"  # 福祉施設
-        return ""
+        return _AMENITY_DATASET_IDS.get(self, "")
+
+
+_AMENITY_DATASET_IDS: dict[AmenityType, str] = {
+    AmenityType.SCHOOL: "XKT008",  # 学校
+    AmenityType.NURSERY: "XKT009",  # 保育園・幼稚園
+    AmenityType.MEDICAL: "XKT010",  # 医療機関
+    AmenityType.WELFARE: "XKT011",  # 福祉施設
+}
 
 
 class FetchNearbyAmenitiesInput(BaseModel):
@@ -3,16 +3,60 @@
 from __future__ import annotations
 
 import logging
-import json
-from typing import Any
+from typing import Any, Iterable
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
 from .gis_helpers import lat_lon_to_tile
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
+# (year, property key) pairs for the projection years published in XKT013
+_YEARS = tuple(
+    (str(year), f"PTN_{year}") for year in (2020, 2025, 2030, 2035, 2040, 2045, 2050)
+)
+
+
+def _extract_mesh_data(
+    features: Iterable[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], int, int]:
+    """Build per-mesh projections and the aggregated 2020/2050 totals.
+
+    The totals only cover meshes that report both 2020 and 2050, and are
+    accumulated in the same pass that extracts each mesh.
+    """
+    mesh_data: list[dict[str, Any]] = []
+    total_2020 = 0
+    total_2050 = 0
+    for f in features:
+        props = f.get("properties", {})
+        mesh_id = props.get("MESH_ID", "Unknown")
+
+        # Extract population projections by year
+        population_by_year = {}
+        for year, key in _YEARS:
+            value = props.get(key)
+            if value:
+                try:
+                    population_by_year[year] = int(value)
+                except (ValueError, TypeError):
+                    pass
+
+        if population_by_year:
+            mesh_data.append(
+                {
+                    "mesh_id": mesh_id,
+                    "population_by_year": population_by_year,
+                }
+            )
+            if "2020" in population_by_year and "2050" in population_by_year:
+                total_2020 += population_by_year["2020"]
+                total_2050 += population_by_year["2050"]
+    return mesh_data, total_2020, total_2050
+
 
 class FetchPopulationTrendInput(BaseModel):
     """Input schema for the fetch_population_trend tool."""
@@ -76,8 +120,8 @@ class FetchPopulationTrendTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -96,6 +140,8 @@ class FetchPopulationTrendTool:
 
         mesh_data: list[dict[str, Any]] = []
         summary: list[str] = []
+        total_2020 = 0
+        total_2050 = 0
 
         try:
             params = {
@@ -110,56 +156,30 @@ class FetchPopulationTrendTool:
                 params=params,
                 response_format="geojson",
                 force_refresh=payload.force_refresh,
+                parse=True,
             )
 
-            data = fetch_result.data
-            if data is None and fetch_result.file_path:
+            # Parsed documents are walked inline; cached tile files are read
+            # and parsed on a worker thread to keep the event loop free.
+            if fetch_result.data is not None:
+                mesh_data, total_2020, total_2050 = _extract_mesh_data(
+                    fetch_result.data.get("features", [])
+                )
+            elif fetch_result.file_path:
                 try:
-                    content = fetch_result.file_path.read_bytes()
-                    data = json.loads(content)
+                    mesh_data, total_2020, total_2050 = await json_codec.run_parser(
+                        _extract_mesh_data,
+                        json_codec.iter_features(fetch_result.file_path),
+                    )
                 except Exception as ex:
                     logger.error(
                         f"Failed to read/parse file {fetch_result.file_path}: {ex}"
                     )
-                    data = {}
-
-            data = data or {}
-            features = data.get("features", [])
-
-            for f in features:
-                props = f.get("properties", {})
-                mesh_id = props.get("MESH_ID", "Unknown")
-
-                # Extract population projections by year
-                population_by_year = {}
-                for year in [2020, 2025, 2030, 2035, 2040, 2045, 2050]:
-                    key = f"PTN_{year}"
-                    if key in props and props[key]:
-                        try:
-                            population_by_year[str(year)] = int(props[key])
-                        except (ValueError, TypeError):
-                            pass
-
-                if population_by_year:
-                    mesh_data.append(
-                        {
-                            "mesh_id": mesh_id,
-                            "population_by_year": population_by_year,
-                        }
-                    )
 
             if mesh_data:
                 summary.append(f"Found population data for {len(mesh_data)} meshes.")
 
-                # Calculate aggregated trend across all meshes when possible
-                total_2020 = 0
-                total_2050 = 0
-                for m in mesh_data:
-                    py = m.get("population_by_year", {})
-                    if "2020" in py and "2050" in py:
-                        total_2020 += int(py["2020"])
-                        total_2050 += int(py["2050"])
-
+                # Aggregated trend across all meshes when possible
                 if total_2020 > 0:
                     change_pct = (total_2050 - total_2020) / total_2020 * 100
                     trend = "decrease" if change_pct < 0 else "increase"
@@ -174,11 +194,13 @@ class FetchPopulationTrendTool:
             logger.error(f"Failed to fetch population data: {e}")
             summary.append(f"Error fetching population data: {e}")
 
-        return FetchPopulationTrendResponse(
+        # mesh_data and summary are built above from parsed ints/strs, so
+        # skip re-validating every mesh entry.
+        return FetchPopulationTrendResponse.model_construct(
             latitude=payload.latitude,
             longitude=payload.longitude,
-            tileCoords={"z": Z, "x": x, "y": y},
-            meshData=mesh_data,
+            tile_coords={"z": Z, "x": x, "y": y},
+            mesh_data=mesh_data,
             summary=summary,
         )
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import json
-from typing import Any
+from typing import Any, Iterable, Mapping
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
 from .gis_helpers import lat_lon_to_tile
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +27,19 @@ class SafetyInfoType(str, Enum):
     @property
     def dataset_id(self) -> str:
         """Return the MLIT dataset ID for this safety info type."""
-        if self == SafetyInfoType.TSUNAMI:
-            return "XKT037"  # 津波浸水想定
-        elif self == SafetyInfoType.STORM_SURGE:
-            return "XKT038"  # 高潮浸水想定
-        elif self == SafetyInfoType.SHELTER:
-            return "XKT016"  # 避難施設
-        return ""
+        return _SAFETY_DATASET_IDS.get(self, "")
+
+
+_SAFETY_DATASET_IDS: dict[SafetyInfoType, str] = {
+    SafetyInfoType.TSUNAMI: "XKT037",  # 津波浸水想定
+    SafetyInfoType.STORM_SURGE: "XKT038",  # 高潮浸水想定
+    SafetyInfoType.SHELTER: "XKT016",  # 避難施設
+}
+
+
+def _feature_properties(features: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collect the non-empty properties of each feature."""
+    return [props for f in features if (props := f.get("properties"))]
 
 
 class FetchSafetyInfoInput(BaseModel):
@@ -106,8 +114,8 @@ class FetchSafetyInfoTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -125,69 +133,83 @@ class FetchSafetyInfoTool:
         safety_info: dict[str, list[dict[str, Any]]] = {}
         summary: list[str] = []
 
-        for info_type in payload.info_types:
-            dataset_id = info_type.dataset_id
-            if not dataset_id:
-                continue
+        # Every dataset is requested for the same tile; the client only reads
+        # params, so a single mapping is shared by all fetches.
+        params = {
+            "response_format": "geojson",
+            "z": Z,
+            "x": x,
+            "y": y,
+        }
 
-            params = {
-                "response_format": "geojson",
-                "z": Z,
-                "x": x,
-                "y": y,
-            }
-
-            try:
-                fetch_result = await self._http_client.fetch(
-                    dataset_id,
-                    params=params,
-                    response_format="geojson",
-                    force_refresh=payload.force_refresh,
-                )
+        # The datasets are independent, so fetch them concurrently
+        info_types = [t for t in payload.info_types if t in _SAFETY_DATASET_IDS]
+        results = await asyncio.gather(
+            *(
+                self._fetch_features(t, params, payload.force_refresh)
+                for t in info_types
+            ),
+            return_exceptions=True,
+        )
 
-                data = fetch_result.data
-                if data is None and fetch_result.file_path:
-                    try:
-                        content = fetch_result.file_path.read_bytes()
-                        data = json.loads(content)
-                    except Exception as ex:
-                        logger.error(
-                            f"Failed to read/parse file {fetch_result.file_path}: {ex}"
-                        )
-                        data = {}
-
-                data = data or {}
-                features = data.get("features", [])
-
-                # Extract properties from features
-                valid_features = []
-                for f in features:
-                    props = f.get("properties", {})
-                    if props:
-                        valid_features.append(props)
-
-                safety_info[info_type.value] = valid_features
-
-                if valid_features:
-                    summary.append(
-                        f"Found {len(valid_features)} {info_type.value} records."
-                    )
-                else:
-                    summary.append(f"No {info_type.value} data in this area.")
-
-            except Exception as e:
-                logger.error(f"Failed to fetch {info_type}: {e}")
+        for info_type, result in zip(info_types, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch {info_type}: {result}")
                 safety_info[info_type.value] = []
-                summary.append(f"Failed to fetch {info_type.value} information: {e}")
+                summary.append(
+                    f"Failed to fetch {info_type.value} information: {result}"
+                )
+                continue
+
+            safety_info[info_type.value] = result
+
+            if result:
+                summary.append(f"Found {len(result)} {info_type.value} records.")
+            else:
+                summary.append(f"No {info_type.value} data in this area.")
 
-        return FetchSafetyInfoResponse(
+        # safety_info holds the upstream feature properties as-is; validating
+        # them would only re-walk every record.
+        return FetchSafetyInfoResponse.model_construct(
             latitude=payload.latitude,
             longitude=payload.longitude,
-            tileCoords={"z": Z, "x": x, "y": y},
-            safetyInfo=safety_info,
+            tile_coords={"z": Z, "x": x, "y": y},
+            safety_info=safety_info,
             summary=summary,
         )
 
+    async def _fetch_features(
+        self,
+        info_type: SafetyInfoType,
+        params: Mapping[str, Any],
+        force_refresh: bool,
+    ) -> list[dict[str, Any]]:
+        """Fetch one safety dataset tile and return its feature properties."""
+        fetch_result = await self._http_client.fetch(
+            _SAFETY_DATASET_IDS[info_type],
+            params=params,
+            response_format="geojson",
+            force_refresh=force_refresh,
+            parse=True,
+        )
+
+        # Use the in-memory document when the client already parsed it;
+        # otherwise stream the cached tile file in a worker thread so disk
+        # reads and parsing do not block the event loop.
+        if fetch_result.data is not None:
+            return _feature_properties(fetch_result.data.get("features", []))
+        if not fetch_result.file_path:
+            return []
+
+        try:
+            return await json_codec.run_parser(
+                _feature_properties,
+                json_codec.iter_features(fetch_result.file_path),
+            )
+        except Exception as ex:
+            logger.error(f"Failed to read/parse file {fetch_result.file_path}: {ex}")
+            return []
+
 
 __all__ = [
     "FetchSafetyInfoInput",
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Literal
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
-from .gis_helpers import encode_mvt_to_base64
+from .gis_helpers import encode_mvt_to_base64, read_tile_file
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
@@ -92,8 +94,8 @@ class FetchSchoolDistrictsTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -121,9 +123,21 @@ class FetchSchoolDistrictsTool:
             force_refresh=payload.force_refresh,
         )
 
-        # Determine response size
+        # Determine response size. File-backed tiles are read in the same
+        # pass (on a worker thread) when the response will inline them.
+        file_content: bytes | None = None
+        geojson_file = False
         if fetch_result.file_path:
-            size_bytes = fetch_result.file_path.stat().st_size
+            geojson_file = (
+                not fetch_result.data
+                and fetch_result.file_path.suffix.lower() in (".json", ".geojson")
+            )
+            size_bytes, file_content = await anyio.to_thread.run_sync(
+                read_tile_file,
+                fetch_result.file_path,
+                payload.response_format == "pbf" or geojson_file,
+                RESOURCE_THRESHOLD_BYTES,
+            )
             is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
         else:
             # Data is in memory
@@ -131,8 +145,7 @@ class FetchSchoolDistrictsTool:
                 size_bytes = len(fetch_result.data)
             else:
                 # Assume JSON/Dict
-                json_str = json.dumps(fetch_result.data)
-                size_bytes = len(json_str.encode("utf-8"))
+                size_bytes = len(json_codec.dumps(fetch_result.data))
             is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
 
         logger.info(
@@ -149,26 +162,28 @@ class FetchSchoolDistrictsTool:
             },
         )
 
-        meta = ResponseMeta(
-            cacheHit=fetch_result.from_cache,
+        # Response models are assembled from values computed here (the GeoJSON
+        # body is passed through untouched), so validation is skipped.
+        meta = ResponseMeta.model_construct(
+            cache_hit=fetch_result.from_cache,
             format=payload.response_format,
-            sizeBytes=size_bytes,
-            isResource=is_large,
+            size_bytes=size_bytes,
+            is_resource=is_large,
         )
 
         if is_large and fetch_result.file_path:
             # Return as resource URI
             fname = fetch_result.file_path.name
             resource_uri = f"resource://mlit/school_districts/{fname}"
-            return FetchSchoolDistrictsResponse(
-                resourceUri=resource_uri,
+            return FetchSchoolDistrictsResponse.model_construct(
+                resource_uri=resource_uri,
                 meta=meta,
             )
 
         if payload.response_format == "pbf":
             # Read MVT/PBF file and encode to base64
             if fetch_result.file_path:
-                mvt_content = fetch_result.file_path.read_bytes()
+                mvt_content = file_content or b""
             else:
                 # fmt: off
                 mvt_content = (
@@ -179,29 +194,29 @@ class FetchSchoolDistrictsTool:
                 # fmt: on
 
             mvt_base64 = encode_mvt_to_base64(mvt_content)
-            return FetchSchoolDistrictsResponse(
-                mvtBase64=mvt_base64,
+            return FetchSchoolDistrictsResponse.model_construct(
+                mvt_base64=mvt_base64,
                 meta=meta,
             )
         else:
             # GeoJSON format
             # If data is in a file, read it (only if it's a JSON/GeoJSON file)
             if fetch_result.file_path and not fetch_result.data:
-                file_ext = fetch_result.file_path.suffix.lower()
-                if file_ext in (".json", ".geojson"):
-                    with open(fetch_result.file_path, "r", encoding="utf-8") as f:
-                        geojson_data = json.load(f)
+                if geojson_file and file_content is not None:
+                    geojson_data = await json_codec.run_parser(
+                        json_codec.loads, file_content
+                    )
                 else:
                     # File is not GeoJSON format (e.g., MVT), cannot parse
                     logger.warning(
                         "Expected GeoJSON file but got %s, returning None",
-                        file_ext,
+                        fetch_result.file_path.suffix.lower(),
                     )
                     geojson_data = None
             else:
                 geojson_data = fetch_result.data
 
-            return FetchSchoolDistrictsResponse(
+            return FetchSchoolDistrictsResponse.model_construct(
                 geojson=geojson_data,
                 meta=meta,
             )
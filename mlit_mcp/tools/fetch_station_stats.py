@@ -3,16 +3,111 @@
 from __future__ import annotations
 
 import logging
-import json
+from pathlib import Path
 from typing import Any, Optional
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from mlit_mcp.http_client import MLITHttpClient
+from mlit_mcp import json_codec
+from mlit_mcp.cache import InMemoryTTLCache
+from mlit_mcp.http_client import FetchResult, MLITHttpClient
 from .gis_helpers import lat_lon_to_tile
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
+# Threshold for switching to resource URI (1MB)
+RESOURCE_THRESHOLD_BYTES = 1024 * 1024
+
+# Generous upper bound on one serialized station record, used to skip
+# measuring lists that cannot reach the resource threshold
+_MAX_STATION_BYTES = 4 * 1024
+
+# Passenger count properties, newest survey year first
+_PASSENGER_KEYS = ("S12_057", "S12_053", "S12_049", "S12_009")
+
+# Keys of a station record, in the order _read_stations stores them
+_STATION_FIELDS = (
+    "station_name",
+    "operator",
+    "line_name",
+    "passenger_count",
+    "coordinates",
+)
+
+# Parsed station lists for recently used tile files (see _load_stations)
+_STATIONS_MEMO = InMemoryTTLCache(maxsize=32, ttl=6 * 60 * 60)
+
+
+def _passenger_count(props: dict[str, Any]) -> int | None:
+    """Return the latest available passenger count from station properties."""
+    for key in _PASSENGER_KEYS:
+        value = props.get(key)
+        if value:
+            try:
+                return int(value)
+            except (ValueError, TypeError):
+                pass
+    return None
+
+
+def _extract_stations(
+    features: list[dict[str, Any]], name_filter: str | None
+) -> list[dict[str, Any]]:
+    """Build station records, keeping names containing ``name_filter``."""
+    needle = name_filter.lower() if name_filter else None
+    stations: list[dict[str, Any]] = []
+    for f in features:
+        props = f.get("properties", {})
+        geom = f.get("geometry", {})
+        coords = geom.get("coordinates", [0, 0])
+
+        station_name = props.get("S12_001_ja", "Unknown")
+
+        # Filter by station name if provided
+        if needle is not None and needle not in station_name.lower():
+            continue
+
+        stations.append(
+            {
+                "station_name": station_name,
+                "operator": props.get("S12_002_ja", "Unknown"),
+                "line_name": props.get("S12_003_ja", "Unknown"),
+                "passenger_count": _passenger_count(props),
+                "coordinates": coords,
+            }
+        )
+    return stations
+
+
+def _freeze(value: Any) -> Any:
+    """Return ``value`` with every nested list turned into a tuple."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of ``_freeze``: turn nested tuples back into lists."""
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _read_stations(path: Path, name_filter: str | None) -> tuple[tuple, ...]:
+    """Parse a cached XKT015 tile file into immutable station rows.
+
+    Rows hold the record values in ``_STATION_FIELDS`` order, with
+    coordinates frozen to tuples, so memoized rows cannot be altered by
+    callers of the tool.
+    """
+    data = json_codec.loads(path.read_bytes()) or {}
+    return tuple(
+        tuple(_freeze(station[field]) for field in _STATION_FIELDS)
+        for station in _extract_stations(data.get("features", []), name_filter)
+    )
+
 
 class FetchStationStatsInput(BaseModel):
     """Input schema for the fetch_station_stats tool."""
@@ -80,6 +175,11 @@ class FetchStationStatsResponse(BaseModel):
     stations: list[dict[str, Any]] = Field(
         description="List of stations with their statistics",
     )
+    resource_uri: Optional[str] = Field(
+        default=None,
+        description="Resource URI of the station list when it is too large to inline",
+        alias="resourceUri",
+    )
     summary: list[str] = Field(
         description="Human readable summary",
     )
@@ -107,24 +207,36 @@ class FetchStationStatsTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
         """Invoke the tool with raw arguments."""
         payload = self.input_model.model_validate(raw_arguments or {})
         result = await self.run(payload)
-        return result.model_dump(by_alias=True, exclude_none=True)
-
-    async def run(self, payload: FetchStationStatsInput) -> FetchStationStatsResponse:
-        """Execute the tool with validated input."""
+        # Station records are plain dicts already in wire format; attach them
+        # as-is rather than having model_dump walk and copy every record.
+        data = result.model_dump(by_alias=True, exclude_none=True, exclude={"stations"})
+        data["stations"] = result.stations
+        return data
+
+    async def run(
+        self, payload: FetchStationStatsInput, *, allow_resource: bool = True
+    ) -> FetchStationStatsResponse:
+        """Execute the tool with validated input.
+
+        Station lists over the resource threshold are saved to the cache and
+        returned by URI unless ``allow_resource`` is false, in which case the
+        full list is always returned inline.
+        """
         # Use zoom level 14 for station search
         Z = 14
 
         stations: list[dict[str, Any]] = []
         summary: list[str] = []
         tile_coords: Optional[dict[str, int]] = None
+        resource_uri: Optional[str] = None
 
         try:
             # Search by coordinates
@@ -146,51 +258,7 @@ class FetchStationStatsTool:
                     force_refresh=payload.force_refresh,
                 )
 
-                data = fetch_result.data
-                if data is None and fetch_result.file_path:
-                    try:
-                        content = fetch_result.file_path.read_bytes()
-                        data = json.loads(content)
-                    except Exception as ex:
-                        logger.error(
-                            f"Failed to read/parse file {fetch_result.file_path}: {ex}"
-                        )
-                        data = {}
-
-                data = data or {}
-                features = data.get("features", [])
-
-                for f in features:
-                    props = f.get("properties", {})
-                    geom = f.get("geometry", {})
-                    coords = geom.get("coordinates", [0, 0])
-
-                    station_name = props.get("S12_001_ja", "Unknown")
-
-                    # Filter by station name if provided
-                    if payload.station_name:
-                        if payload.station_name.lower() not in station_name.lower():
-                            continue
-
-                    # Extract passenger count (latest available year)
-                    passenger_count = None
-                    for key in ["S12_057", "S12_053", "S12_049", "S12_009"]:
-                        if key in props and props[key]:
-                            try:
-                                passenger_count = int(props[key])
-                                break
-                            except (ValueError, TypeError):
-                                pass
-
-                    stations.append(
-                        {
-                            "station_name": station_name,
-                            "operator": props.get("S12_002_ja", "Unknown"),
-                            "line_name": props.get("S12_003_ja", "Unknown"),
-                            "passenger_count": passenger_count,
-                            "coordinates": coords,
-                        }
-                    )
+                stations = await self._load_stations(fetch_result, payload.station_name)
 
                 if stations:
                     summary.append(f"Found {len(stations)} stations in the area.")
@@ -219,48 +287,7 @@ class FetchStationStatsTool:
                     force_refresh=payload.force_refresh,
                 )
 
-                data = fetch_result.data
-                if data is None and fetch_result.file_path:
-                    try:
-                        content = fetch_result.file_path.read_bytes()
-                        data = json.loads(content)
-                    except Exception as ex:
-                        logger.error(
-                            f"Failed to read/parse file {fetch_result.file_path}: {ex}"
-                        )
-                        data = {}
-
-                data = data or {}
-                features = data.get("features", [])
-
-                for f in features:
-                    props = f.get("properties", {})
-                    geom = f.get("geometry", {})
-                    coords = geom.get("coordinates", [0, 0])
-
-                    station_name = props.get("S12_001_ja", "Unknown")
-                    if payload.station_name.lower() not in station_name.lower():
-                        continue
-
-                    # Extract passenger count (latest available year)
-                    passenger_count = None
-                    for key in ["S12_057", "S12_053", "S12_049", "S12_009"]:
-                        if key in props and props[key]:
-                            try:
-                                passenger_count = int(props[key])
-                                break
-                            except (ValueError, TypeError):
-                                pass
-
-                    stations.append(
-                        {
-                            "station_name": station_name,
-                            "operator": props.get("S12_002_ja", "Unknown"),
-                            "line_name": props.get("S12_003_ja", "Unknown"),
-                            "passenger_count": passenger_count,
-                            "coordinates": coords,
-                        }
-                    )
+                stations = await self._load_stations(fetch_result, payload.station_name)
 
                 if stations:
                     summary.append(
@@ -271,6 +298,23 @@ class FetchStationStatsTool:
                         f"No stations found matching '{payload.station_name}'."
                     )
 
+            if (
+                allow_resource
+                and tile_coords
+                and len(stations) * _MAX_STATION_BYTES > RESOURCE_THRESHOLD_BYTES
+            ):
+                cache_key = (
+                    f"station_stats:XKT015:{tile_coords['z']}/{tile_coords['x']}/"
+                    f"{tile_coords['y']}:{payload.station_name or ''}"
+                )
+                file_path = await anyio.to_thread.run_sync(
+                    self._save_if_large, cache_key, stations
+                )
+                if file_path is not None:
+                    resource_uri = f"resource://mlit/station_stats/{file_path.name}"
+                    summary.append(f"Station list saved as a resource: {resource_uri}")
+                    stations = []
+
         except Exception as e:
             logger.error(f"Failed to fetch station stats: {e}")
             summary.append(f"Error fetching station data: {e}")
@@ -280,9 +324,54 @@ class FetchStationStatsTool:
             longitude=payload.longitude,
             tileCoords=tile_coords,
             stations=stations,
+            resourceUri=resource_uri,
             summary=summary,
         )
 
+    def _save_if_large(
+        self, cache_key: str, stations: list[dict[str, Any]]
+    ) -> Path | None:
+        """Save ``stations`` to the cache if they exceed the resource threshold."""
+        content = json_codec.dumps(stations)
+        if len(content) <= RESOURCE_THRESHOLD_BYTES:
+            return None
+        return self._http_client.save_to_cache(cache_key, content, ".json")
+
+    async def _load_stations(
+        self, fetch_result: FetchResult, name_filter: str | None
+    ) -> list[dict[str, Any]]:
+        """Return station records for a fetched XKT015 tile.
+
+        Records parsed from a cached tile file are memoized by the file's
+        identity (path, mtime, size) and the name filter, so repeat queries
+        skip re-parsing. Refetching or clearing the HTTP cache replaces or
+        removes the file and thereby invalidates the entry.
+        """
+        data = fetch_result.data
+        if data is not None or not fetch_result.file_path:
+            return _extract_stations((data or {}).get("features", []), name_filter)
+
+        # File I/O and parsing run on a worker thread; the memo itself is
+        # only touched from the event loop.
+        path = fetch_result.file_path
+        try:
+            stat = await anyio.to_thread.run_sync(path.stat)
+            memo_key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}:{name_filter or ''}"
+            stations = _STATIONS_MEMO.get(memo_key)
+            if stations is None:
+                stations = await json_codec.run_parser(
+                    _read_stations, path, name_filter
+                )
+                _STATIONS_MEMO.set(memo_key, stations)
+        except Exception as ex:
+            logger.error(f"Failed to read/parse file {path}: {ex}")
+            return []
+        # Build fresh records on every call; the memo only holds frozen rows
+        return [
+            {field: _thaw(value) for field, value in zip(_STATION_FIELDS, row)}
+            for row in stations
+        ]
+
 
 __all__ = [
     "FetchStationStatsInput",
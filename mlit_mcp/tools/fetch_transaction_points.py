@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import json
 import logging
+from pathlib import Path
 from typing import Any, Literal
 
+import anyio
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
+from .gis_helpers import tile_to_bbox
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +121,30 @@ class FetchTransactionPointsResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+def _point_lon_lat(feature: dict[str, Any]) -> tuple[Any, Any] | None:
+    """Return (lon, lat) for a Point feature, or None for anything else."""
+    geometry = feature.get("geometry")
+    if not geometry or geometry.get("type") != "Point":
+        return None
+
+    coordinates = geometry.get("coordinates")
+    if not coordinates or len(coordinates) < 2:
+        return None
+
+    return coordinates[0], coordinates[1]
+
+
+def _bbox_covers_tile(bbox: BoundingBox, z: int, x: int, y: int) -> bool:
+    """Return True if ``bbox`` contains the bounds of tile z/x/y."""
+    min_lon, min_lat, max_lon, max_lat = tile_to_bbox(z, x, y)
+    return (
+        bbox.min_lon <= min_lon
+        and bbox.min_lat <= min_lat
+        and bbox.max_lon >= max_lon
+        and bbox.max_lat >= max_lat
+    )
+
+
 class FetchTransactionPointsTool:
     """Tool implementation for fetching transaction points as GeoJSON.
 
@@ -138,8 +167,8 @@ class FetchTransactionPointsTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -173,27 +202,44 @@ class FetchTransactionPointsTool:
             force_refresh=payload.force_refresh,
         )
 
-        # Determine response size
-        if fetch_result.file_path:
-            size_bytes = fetch_result.file_path.stat().st_size
-            is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
+        # Determine response size; the client reports it for fresh downloads
+        if fetch_result.size_bytes is not None:
+            size_bytes = fetch_result.size_bytes
+        elif fetch_result.file_path:
+            stat = await anyio.to_thread.run_sync(fetch_result.file_path.stat)
+            size_bytes = stat.st_size
         else:
             # Data is in memory
-            geojson_str = json.dumps(fetch_result.data)
-            size_bytes = len(geojson_str.encode("utf-8"))
-            is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
-
-        # Apply bbox filter if provided (only for geojson format)
+            size_bytes = len(json_codec.dumps(fetch_result.data))
+        is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
+        # Large cached files are handed out as a resource URI, so their
+        # contents are never parsed or filtered here.
+        as_resource = is_large and fetch_result.file_path is not None
+
+        # Apply bbox filter if provided (only for geojson format). A bbox that
+        # covers the whole requested tile cannot exclude any of its features.
+        bbox = payload.bbox if payload.response_format == "geojson" else None
+        if bbox is not None and _bbox_covers_tile(
+            bbox, payload.z, payload.x, payload.y
+        ):
+            bbox = None
         geojson_data = fetch_result.data
-        if not geojson_data and fetch_result.file_path and not is_large:
+        if as_resource:
+            geojson_data = None
+        elif not geojson_data and fetch_result.file_path:
+            # XPT001 tiles arrive as cached files. Below the resource threshold
+            # they are small enough to parse whole with the fast codec and
+            # filter in one vectorized pass, both on a worker thread.
             try:
-                content = fetch_result.file_path.read_bytes()
-                geojson_data = json.loads(content)
+                geojson_data = await json_codec.run_parser(
+                    self._load_geojson, fetch_result.file_path, bbox
+                )
             except Exception as e:
                 logger.error(f"Failed to read/parse file {fetch_result.file_path}: {e}")
-
-        if payload.bbox and geojson_data and payload.response_format == "geojson":
-            geojson_data = self._filter_by_bbox(geojson_data, payload.bbox)
+        elif bbox is not None and geojson_data:
+            # Already-parsed data may be shared with the caller, so filter a
+            # shallow copy rather than the caller's mapping.
+            geojson_data = self._filter_by_bbox(dict(geojson_data), bbox)
 
         logger.info(
             "fetch_transaction_points",
@@ -238,30 +284,37 @@ class FetchTransactionPointsTool:
         if not isinstance(geojson, dict) or "features" not in geojson:
             return geojson
 
-        filtered_features = []
-        for feature in geojson.get("features", []):
-            if self._is_in_bbox(feature, bbox):
-                filtered_features.append(feature)
-
-        return {
-            **geojson,
-            "features": filtered_features,
-        }
-
-    def _is_in_bbox(self, feature: dict[str, Any], bbox: BoundingBox) -> bool:
-        """Check if a GeoJSON feature is within the bounding box."""
-        geometry = feature.get("geometry")
-        if not geometry or geometry.get("type") != "Point":
-            return True  # Include non-point features
-
-        coordinates = geometry.get("coordinates")
-        if not coordinates or len(coordinates) < 2:
-            return True
-
-        lon, lat = coordinates[0], coordinates[1]
-        return (
-            bbox.min_lon <= lon <= bbox.max_lon and bbox.min_lat <= lat <= bbox.max_lat
-        )
+        features = geojson.get("features", [])
+
+        # Gather point coordinates into an (N, 2) array, then test them all
+        # against the bbox in one vectorized pass. Non-point features are
+        # always kept.
+        point_indices: list[int] = []
+        lon_lats: list[tuple[Any, Any]] = []
+        for i, feature in enumerate(features):
+            lon_lat = _point_lon_lat(feature)
+            if lon_lat is not None:
+                point_indices.append(i)
+                lon_lats.append(lon_lat)
+
+        keep = np.ones(len(features), dtype=bool)
+        if point_indices:
+            coords = np.array(lon_lats, dtype=np.float64).reshape(-1, 2)
+            lo = np.array([bbox.min_lon, bbox.min_lat])
+            hi = np.array([bbox.max_lon, bbox.max_lat])
+            keep[point_indices] = ((coords >= lo) & (coords <= hi)).all(axis=1)
+
+        # Callers hand over a mapping they own (freshly parsed from the file
+        # cache, or a shallow copy), so the feature list is replaced in place.
+        geojson["features"] = [features[i] for i in np.flatnonzero(keep)]
+        return geojson
+
+    def _load_geojson(self, path: Path, bbox: BoundingBox | None) -> Any:
+        """Parse a cached GeoJSON file, keeping only features inside ``bbox``."""
+        geojson = json_codec.loads(path.read_bytes())
+        if bbox is not None and geojson:
+            geojson = self._filter_by_bbox(geojson, bbox)
+        return geojson
 
 
 __all__ = [
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import Any, Literal
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +95,51 @@ class FetchTransactionsResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+def _extract_records(year_data: Any) -> list[Any]:
+    """Return the transaction records from one XIT001 year response."""
+    # The API usually returns {"status": "OK", "data": [...]}, so that shape
+    # is checked first with a single lookup.
+    if isinstance(year_data, dict):
+        records = year_data.get("data")
+        if isinstance(records, list):
+            return records
+        if year_data.get("status") == "OK":
+            # Fallback if structure is different but has status OK
+            return []
+        # If it's a single record or other structure, add as is
+        return [year_data]
+    if isinstance(year_data, list):
+        return year_data
+    return []
+
+
+def _encode_items(records: list[Any]) -> memoryview:
+    """Encode records as the comma-separated items of a JSON array.
+
+    The brackets are sliced off through a memoryview, so the encoded
+    buffer is not copied.
+    """
+    return memoryview(json_codec.dumps(records))[1:-1]
+
+
+def _join_array(chunks: list[memoryview]) -> bytes:
+    """Join item chunks from _encode_items into a JSON array in one copy."""
+    pieces: list[bytes | memoryview] = [b"["]
+    for i, chunk in enumerate(chunks):
+        if i:
+            pieces.append(b",")
+        pieces.append(chunk)
+    pieces.append(b"]")
+    return b"".join(pieces)
+
+
+def _save_array(
+    http_client: MLITHttpClient, cache_key: str, chunks: list[memoryview]
+) -> Path:
+    """Write the joined JSON array to the file cache and return its path."""
+    return http_client.save_to_cache(cache_key, _join_array(chunks), suffix=".json")
+
+
 class FetchTransactionsTool:
     """Tool implementation for fetching transaction data from MLIT XIT001 API."""
 
@@ -109,14 +159,19 @@ class FetchTransactionsTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
         payload = self.input_model.model_validate(raw_arguments or {})
         result = await self.run(payload)
-        return result.model_dump(by_alias=True, exclude_none=True)
+        # The records are plain API dicts; attach them as-is rather than having
+        # model_dump walk and copy every record.
+        dumped = result.model_dump(by_alias=True, exclude_none=True, exclude={"data"})
+        if result.data is None:
+            return dumped
+        return {"data": result.data, **dumped}
 
     async def run(self, payload: FetchTransactionsInput) -> FetchTransactionsResponse:
         # XIT001 API uses 'year' parameter, not 'from'/'to'
@@ -133,39 +188,34 @@ class FetchTransactionsTool:
         if payload.classification:
             params_base["priceClassification"] = payload.classification
 
-        for year in range(payload.from_year, payload.to_year + 1):
-            params = params_base.copy()
-            params["year"] = str(year)
-
-            fetch_result = await self._http_client.fetch(
-                "XIT001",
-                params=params,
-                response_format="json",
-                force_refresh=payload.force_refresh,
+        # Years are independent requests; fetch them concurrently. The HTTP
+        # client's semaphore keeps the number of in-flight requests bounded.
+        years = range(payload.from_year, payload.to_year + 1)
+        results = await asyncio.gather(
+            *(
+                self._http_client.fetch(
+                    "XIT001",
+                    params={**params_base, "year": str(year)},
+                    response_format="json",
+                    force_refresh=payload.force_refresh,
+                )
+                for year in years
             )
+        )
 
-            year_data = fetch_result.data
-            # Extract data from response if it's wrapped
-            # The API usually returns {"data": [...], "status": "OK"} or similar
-            if isinstance(year_data, dict):
-                if "data" in year_data and isinstance(year_data["data"], list):
-                    all_data.extend(year_data["data"])
-                elif "status" in year_data and year_data.get("status") == "OK":
-                    if "data" in year_data and isinstance(year_data["data"], list):
-                        all_data.extend(year_data["data"])
-                    # Fallback if structure is different but has status OK
-                    pass
-                else:
-                    # If it's a single record or other structure, add as is
-                    all_data.append(year_data)
-            elif isinstance(year_data, list):
-                all_data.extend(year_data)
-
-        # Check size of aggregated data
-        import json
-
-        json_str = json.dumps(all_data, ensure_ascii=False)
-        size_bytes = len(json_str.encode("utf-8"))
+        # Results come back in year order, so the output stays deterministic.
+        # Each year's records are encoded as they are merged; the size check
+        # and the resource file reuse these chunks instead of serializing the
+        # combined list a second time.
+        chunks: list[memoryview] = []
+        for fetch_result in results:
+            records = _extract_records(fetch_result.data)
+            if records:
+                all_data.extend(records)
+                chunks.append(_encode_items(records))
+
+        # Size of the combined JSON array: brackets plus "," separators
+        size_bytes = 2 + sum(len(chunk) for chunk in chunks) + max(len(chunks) - 1, 0)
         is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
 
         resource_uri = None
@@ -177,8 +227,10 @@ class FetchTransactionsTool:
                 f"transactions:XIT001:{payload.area}:{payload.from_year}-"
                 f"{payload.to_year}:{payload.classification}:{payload.format}"
             )
-            file_path = self._http_client.save_to_cache(
-                cache_key, json_str.encode("utf-8"), suffix=".json"
+            # Assemble and write the file on a worker thread so a multi-MB
+            # write does not stall the event loop.
+            file_path = await anyio.to_thread.run_sync(
+                _save_array, self._http_client, cache_key, chunks
             )
             resource_uri = f"resource://mlit/transactions/{file_path.name}"
             data_to_return = None
@@ -197,13 +249,15 @@ class FetchTransactionsTool:
             },
         )
 
-        meta = ResponseMeta(
-            cacheHit=False,
+        # The records are passed through from the API as-is and the other
+        # values are computed here, so validation is skipped.
+        meta = ResponseMeta.model_construct(
+            cache_hit=False,
             format=payload.format,
         )
-        return FetchTransactionsResponse(
+        return FetchTransactionsResponse.model_construct(
             data=data_to_return,
-            resourceUri=resource_uri,
+            resource_uri=resource_uri,
             meta=meta,
         )
 
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any, Literal
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
-from .gis_helpers import encode_mvt_to_base64
+from .gis_helpers import encode_file_to_base64, encode_mvt_to_base64, read_tile_file
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
 # Threshold for switching to resource URI (1MB)
 RESOURCE_THRESHOLD_BYTES = 1024 * 1024
 
+# PBF tiles up to this size are base64-encoded directly on the event loop
+INLINE_ENCODE_MAX_BYTES = 64 * 1024
+
 
 class FetchUrbanPlanningZonesInput(BaseModel):
     """Input schema for the fetch_urban_planning_zones tool."""
@@ -34,6 +40,13 @@ class FetchUrbanPlanningZonesInput(BaseModel):
         alias="forceRefresh",
         description="If true, bypass cache and fetch fresh data",
     )
+    prefetch_neighbors: bool = Field(
+        default=False,
+        alias="prefetchNeighbors",
+        description=(
+            "If true, fetch the 8 surrounding tiles into the cache in the background"
+        ),
+    )
 
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
 
@@ -72,13 +85,15 @@ class FetchUrbanPlanningZonesTool:
 
     def __init__(self, http_client: MLITHttpClient) -> None:
         self._http_client = http_client
+        # Strong references to in-flight neighbor prefetches
+        self._prefetch_tasks: set[asyncio.Task[None]] = set()
 
     def descriptor(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -103,9 +118,23 @@ class FetchUrbanPlanningZonesTool:
             force_refresh=payload.force_refresh,
         )
 
-        # Determine response size
+        if payload.prefetch_neighbors:
+            # Detached on purpose: the prefetch only warms the cache, logs and
+            # drops its own failures, and the caller should not wait for it.
+            task = asyncio.create_task(self._prefetch_neighbors(payload))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+
+        # Determine response size. File-backed tiles are read in the same
+        # pass (on a worker thread) when the response will inline them.
+        file_content: bytes | None = None
         if fetch_result.file_path:
-            size_bytes = fetch_result.file_path.stat().st_size
+            size_bytes, file_content = await anyio.to_thread.run_sync(
+                read_tile_file,
+                fetch_result.file_path,
+                payload.response_format == "geojson" and not fetch_result.data,
+                RESOURCE_THRESHOLD_BYTES,
+            )
             is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
         else:
             # Data is in memory
@@ -113,8 +142,7 @@ class FetchUrbanPlanningZonesTool:
                 size_bytes = len(fetch_result.data)
             else:
                 # Assume JSON/Dict
-                json_str = json.dumps(fetch_result.data)
-                size_bytes = len(json_str.encode("utf-8"))
+                size_bytes = len(json_codec.dumps(fetch_result.data))
             is_large = size_bytes > RESOURCE_THRESHOLD_BYTES
 
         logger.info(
@@ -130,54 +158,104 @@ class FetchUrbanPlanningZonesTool:
             },
         )
 
-        meta = ResponseMeta(
-            cacheHit=fetch_result.from_cache,
+        # Response models are assembled from values computed here (the GeoJSON
+        # body is passed through untouched), so validation is skipped.
+        meta = ResponseMeta.model_construct(
+            cache_hit=fetch_result.from_cache,
             format=payload.response_format,
-            sizeBytes=size_bytes,
-            isResource=is_large,
+            size_bytes=size_bytes,
+            is_resource=is_large,
         )
 
         if is_large and fetch_result.file_path:
             # Return as resource URI
             fname = fetch_result.file_path.name
             resource_uri = f"resource://mlit/urban_planning_zones/{fname}"
-            return FetchUrbanPlanningZonesResponse(
-                resourceUri=resource_uri,
+            return FetchUrbanPlanningZonesResponse.model_construct(
+                resource_uri=resource_uri,
                 meta=meta,
             )
 
-        # Load data if not large and data is missing (e.g., cached as file)
+        # Load data if not large and data is missing (e.g., cached as file).
+        # PBF bytes are never JSON, and parsing runs on a worker thread.
         geojson_data = fetch_result.data
-        if not geojson_data and fetch_result.file_path and not is_large:
+        if (
+            payload.response_format == "geojson"
+            and not geojson_data
+            and file_content is not None
+        ):
             try:
-                content = fetch_result.file_path.read_bytes()
-                geojson_data = json.loads(content)
+                geojson_data = await json_codec.run_parser(
+                    json_codec.loads, file_content
+                )
             except Exception as e:
                 logger.error(f"Failed to read/parse file {fetch_result.file_path}: {e}")
                 # Fallback to None or raise? None is safer here.
 
         if payload.response_format == "pbf":
-            # Read PBF file and encode to base64
             if fetch_result.file_path:
-                pbf_content = fetch_result.file_path.read_bytes()
-            else:
-                # If data is in memory
-                pbf_content = (
-                    fetch_result.data if isinstance(fetch_result.data, bytes) else b""
+                # Encode the PBF file chunk by chunk on a worker thread, so
+                # the raw tile is never held in memory alongside its base64
+                pbf_base64 = await anyio.to_thread.run_sync(
+                    encode_file_to_base64, fetch_result.file_path
+                )
+                return FetchUrbanPlanningZonesResponse.model_construct(
+                    pbf_base64=pbf_base64,
+                    meta=meta,
                 )
 
-            pbf_base64 = encode_mvt_to_base64(pbf_content)
-            return FetchUrbanPlanningZonesResponse(
-                pbfBase64=pbf_base64,
+            # If data is in memory
+            pbf_content = (
+                fetch_result.data if isinstance(fetch_result.data, bytes) else b""
+            )
+            if len(pbf_content) > INLINE_ENCODE_MAX_BYTES:
+                # Larger tiles are encoded on a worker thread
+                pbf_base64 = await anyio.to_thread.run_sync(
+                    encode_mvt_to_base64, pbf_content
+                )
+            else:
+                pbf_base64 = encode_mvt_to_base64(pbf_content)
+            return FetchUrbanPlanningZonesResponse.model_construct(
+                pbf_base64=pbf_base64,
                 meta=meta,
             )
         else:
             # GeoJSON format
-            return FetchUrbanPlanningZonesResponse(
+            return FetchUrbanPlanningZonesResponse.model_construct(
                 geojson=geojson_data,
                 meta=meta,
             )
 
+    async def _prefetch_neighbors(self, payload: FetchUrbanPlanningZonesInput) -> None:
+        """Warm the HTTP cache with the tiles surrounding payload's tile.
+
+        Tiles are fetched one at a time, so the prefetch holds at most one of
+        the client's concurrency slots and foreground calls never queue
+        behind it. Tiles already cached are served by the client without a
+        request; failures are logged and otherwise ignored.
+        """
+        n = 2**payload.z
+        neighbors = [
+            (x, y)
+            for x in range(payload.x - 1, payload.x + 2)
+            for y in range(payload.y - 1, payload.y + 2)
+            if (x, y) != (payload.x, payload.y) and 0 <= x < n and 0 <= y < n
+        ]
+        for x, y in neighbors:
+            try:
+                await self._http_client.fetch(
+                    "XKT001",
+                    params={
+                        "response_format": payload.response_format,
+                        "z": payload.z,
+                        "x": x,
+                        "y": y,
+                    },
+                    response_format=payload.response_format,
+                )
+            except Exception as e:
+                logger.debug(f"Prefetch of tile {payload.z}/{x}/{y} failed: {e}")
+
 
 __all__ = [
     "FetchUrbanPlanningZonesInput",
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from mlit_mcp.http_client import MLITHttpClient
+from .fetch_nearby_amenities import FetchNearbyAmenitiesInput, FetchNearbyAmenitiesTool
+from .fetch_population_trend import FetchPopulationTrendInput, FetchPopulationTrendTool
+from .fetch_safety_info import FetchSafetyInfoInput, FetchSafetyInfoTool
+from .fetch_station_stats import FetchStationStatsInput, FetchStationStatsTool
 from .gis_helpers import lat_lon_to_tile
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
@@ -66,21 +72,31 @@ class GenerateAreaReportTool:
 
     def __init__(self, http_client: MLITHttpClient) -> None:
         self._http_client = http_client
+        # The sub-tools are stateless apart from the shared client, so one
+        # instance of each serves every report.
+        self._safety_tool = FetchSafetyInfoTool(http_client=http_client)
+        self._amenity_tool = FetchNearbyAmenitiesTool(http_client=http_client)
+        self._population_tool = FetchPopulationTrendTool(http_client=http_client)
+        self._station_tool = FetchStationStatsTool(http_client=http_client)
 
     def descriptor(self) -> dict[str, Any]:
         """Return the tool descriptor for MCP."""
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
         """Invoke the tool with raw arguments."""
         payload = self.input_model.model_validate(raw_arguments or {})
         result = await self.run(payload)
-        return result.model_dump(by_alias=True, exclude_none=True)
+        # Sections are plain dicts already in wire format; attach them as-is
+        # rather than having model_dump walk and copy every nested value.
+        data = result.model_dump(by_alias=True, exclude_none=True, exclude={"sections"})
+        data["sections"] = result.sections
+        return data
 
     async def run(self, payload: GenerateAreaReportInput) -> GenerateAreaReportResponse:
         """Execute the tool with validated input."""
@@ -96,150 +112,134 @@ class GenerateAreaReportTool:
         report_parts.append(f"**Tile**: z={Z}, x={x}, y={y}")
         report_parts.append("")
 
-        # Section 1: Hazard Risks
-        try:
-            from .fetch_safety_info import FetchSafetyInfoInput, FetchSafetyInfoTool
-
-            safety_tool = FetchSafetyInfoTool(http_client=self._http_client)
-            safety_input = FetchSafetyInfoInput(
-                latitude=lat,
-                longitude=lon,
-                forceRefresh=payload.force_refresh,
-            )
-            safety_result = await safety_tool.run(safety_input)
-
-            sections["safety"] = {
-                "summary": safety_result.summary,
-                "data_count": {k: len(v) for k, v in safety_result.safety_info.items()},
-            }
-
-            report_parts.append("## Safety Information")
-            for line in safety_result.summary:
-                report_parts.append(f"- {line}")
-            report_parts.append("")
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch safety info: {e}")
-            report_parts.append("## Safety Information")
-            report_parts.append(f"*Data unavailable: {e}*")
-            report_parts.append("")
-
-        # Section 2: Nearby Amenities
-        try:
-            from .fetch_nearby_amenities import (
-                FetchNearbyAmenitiesInput,
-                FetchNearbyAmenitiesTool,
-            )
-
-            amenity_tool = FetchNearbyAmenitiesTool(http_client=self._http_client)
-            amenity_input = FetchNearbyAmenitiesInput(
-                latitude=lat,
-                longitude=lon,
-                forceRefresh=payload.force_refresh,
-            )
-            amenity_result = await amenity_tool.run(amenity_input)
-
-            sections["amenities"] = {
-                "summary": amenity_result.summary,
-                "counts": {k: len(v) for k, v in amenity_result.amenities.items()},
-            }
-
-            report_parts.append("## Nearby Amenities")
-            for line in amenity_result.summary:
-                report_parts.append(f"- {line}")
-            report_parts.append("")
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch amenities: {e}")
-            report_parts.append("## Nearby Amenities")
-            report_parts.append(f"*Data unavailable: {e}*")
-            report_parts.append("")
-
-        # Section 3: Population Trend
-        try:
-            from .fetch_population_trend import (
-                FetchPopulationTrendInput,
-                FetchPopulationTrendTool,
-            )
-
-            pop_tool = FetchPopulationTrendTool(http_client=self._http_client)
-            pop_input = FetchPopulationTrendInput(
-                latitude=lat,
-                longitude=lon,
-                forceRefresh=payload.force_refresh,
-            )
-            pop_result = await pop_tool.run(pop_input)
-
-            sections["population"] = {
-                "summary": pop_result.summary,
-                "mesh_count": len(pop_result.mesh_data),
-            }
-
-            report_parts.append("## Population Trends")
-            for line in pop_result.summary:
-                report_parts.append(f"- {line}")
-            report_parts.append("")
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch population data: {e}")
-            report_parts.append("## Population Trends")
-            report_parts.append(f"*Data unavailable: {e}*")
-            report_parts.append("")
-
-        # Section 4: Station Access
-        try:
-            from .fetch_station_stats import (
-                FetchStationStatsInput,
-                FetchStationStatsTool,
-            )
-
-            station_tool = FetchStationStatsTool(http_client=self._http_client)
-            station_input = FetchStationStatsInput(
-                latitude=lat,
-                longitude=lon,
-                forceRefresh=payload.force_refresh,
-            )
-            station_result = await station_tool.run(station_input)
-
-            sections["stations"] = {
-                "summary": station_result.summary,
-                "station_count": len(station_result.stations),
-            }
-
-            report_parts.append("## Station Access")
-            for line in station_result.summary:
-                report_parts.append(f"- {line}")
-            if station_result.stations:
-                report_parts.append("")
-                report_parts.append("### Nearby Stations")
-                for station in station_result.stations[:5]:
-                    name = station.get("station_name", "Unknown")
-                    line_name = station.get("line_name", "")
-                    passengers = station.get("passenger_count")
-                    if passengers:
-                        report_parts.append(
-                            f"- **{name}** ({line_name}): "
-                            f"{passengers:,} passengers/day"
-                        )
-                    else:
-                        report_parts.append(f"- **{name}** ({line_name})")
-            report_parts.append("")
+        # The sections are independent, so their data is fetched concurrently;
+        # the report is assembled in a fixed section order afterwards.
+        section_specs = (
+            ("safety", "Safety Information", "safety info", self._safety_section),
+            ("amenities", "Nearby Amenities", "amenities", self._amenity_section),
+            (
+                "population",
+                "Population Trends",
+                "population data",
+                self._population_section,
+            ),
+            ("stations", "Station Access", "station data", self._station_section),
+        )
+        results = await asyncio.gather(
+            *(
+                build(lat, lon, payload.force_refresh)
+                for _, _, _, build in section_specs
+            ),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch station data: {e}")
-            report_parts.append("## Station Access")
-            report_parts.append(f"*Data unavailable: {e}*")
+        for (key, heading, label, _), result in zip(section_specs, results):
+            report_parts.append(f"## {heading}")
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to fetch {label}: {result}")
+                report_parts.append(f"*Data unavailable: {result}*")
+            else:
+                sections[key], lines = result
+                report_parts.extend(lines)
             report_parts.append("")
 
         report = "\n".join(report_parts)
 
-        return GenerateAreaReportResponse(
+        # The report and sections are built above from the sub-tools'
+        # results, so skip re-validating them.
+        return GenerateAreaReportResponse.model_construct(
             latitude=payload.latitude,
             longitude=payload.longitude,
             report=report,
             sections=sections,
         )
 
+    async def _safety_section(
+        self, lat: float, lon: float, force_refresh: bool
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return the safety section data and its report lines."""
+        safety_input = FetchSafetyInfoInput(
+            latitude=lat,
+            longitude=lon,
+            forceRefresh=force_refresh,
+        )
+        safety_result = await self._safety_tool.run(safety_input)
+
+        section = {
+            "summary": safety_result.summary,
+            "data_count": {k: len(v) for k, v in safety_result.safety_info.items()},
+        }
+        return section, [f"- {line}" for line in safety_result.summary]
+
+    async def _amenity_section(
+        self, lat: float, lon: float, force_refresh: bool
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return the amenities section data and its report lines."""
+        amenity_input = FetchNearbyAmenitiesInput(
+            latitude=lat,
+            longitude=lon,
+            forceRefresh=force_refresh,
+        )
+        amenity_result = await self._amenity_tool.run(amenity_input)
+
+        section = {
+            "summary": amenity_result.summary,
+            "counts": {k: len(v) for k, v in amenity_result.amenities.items()},
+        }
+        return section, [f"- {line}" for line in amenity_result.summary]
+
+    async def _population_section(
+        self, lat: float, lon: float, force_refresh: bool
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return the population section data and its report lines."""
+        pop_input = FetchPopulationTrendInput(
+            latitude=lat,
+            longitude=lon,
+            forceRefresh=force_refresh,
+        )
+        pop_result = await self._population_tool.run(pop_input)
+
+        section = {
+            "summary": pop_result.summary,
+            "mesh_count": len(pop_result.mesh_data),
+        }
+        return section, [f"- {line}" for line in pop_result.summary]
+
+    async def _station_section(
+        self, lat: float, lon: float, force_refresh: bool
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return the station section data and its report lines."""
+        station_input = FetchStationStatsInput(
+            latitude=lat,
+            longitude=lon,
+            forceRefresh=force_refresh,
+        )
+        # The report needs the station list itself, not a resource URI
+        station_result = await self._station_tool.run(
+            station_input, allow_resource=False
+        )
+
+        section = {
+            "summary": station_result.summary,
+            "station_count": len(station_result.stations),
+        }
+
+        lines = [f"- {line}" for line in station_result.summary]
+        if station_result.stations:
+            lines.append("")
+            lines.append("### Nearby Stations")
+            for station in station_result.stations[:5]:
+                name = station.get("station_name", "Unknown")
+                line_name = station.get("line_name", "")
+                passengers = station.get("passenger_count")
+                if passengers:
+                    lines.append(
+                        f"- **{name}** ({line_name}): " f"{passengers:,} passengers/day"
+                    )
+                else:
+                    lines.append(f"- **{name}** ({line_name})")
+        return section, lines
+
 
 __all__ = [
     "GenerateAreaReportInput",
@@ -1,16 +1,83 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from statistics import quantiles, median
-from typing import Any
+from typing import Any, Iterable
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from mlit_mcp.http_client import MLITHttpClient
+from .schema_helpers import json_schema
 
 logger = logging.getLogger(__name__)
 
 
+_INT64 = np.iinfo(np.int64)
+
+
+def _parse_ints(values: Iterable[Any]) -> Iterable[int]:
+    """Yield each value that parses as an int64, skipping the rest."""
+    for value in values:
+        try:
+            parsed = int(value)
+        except (ValueError, TypeError):
+            continue
+        if _INT64.min <= parsed <= _INT64.max:
+            yield parsed
+
+
+def _trade_prices(records: Iterable[dict[str, Any]]) -> np.ndarray:
+    """Return the parseable TradePrice of each record as an int64 array."""
+    values = [value for record in records if (value := record.get("TradePrice"))]
+    try:
+        # One C-level conversion when every price is an integer string
+        return np.array(values, dtype=np.int64)
+    except (ValueError, TypeError, OverflowError):
+        # Some prices are malformed or out of range; parse one by one and
+        # skip those
+        return np.fromiter(_parse_ints(values), dtype=np.int64)
+
+
+def _order_stats(
+    prices: np.ndarray,
+) -> tuple[int, int, int, int | None, int | None]:
+    """Return min, max, median and the 25th/75th percentiles of ``prices``.
+
+    Every needed order statistic is selected by one np.partition call, which
+    is O(n) instead of a full sort. Percentiles interpolate exactly like
+    statistics.quantiles' default exclusive method and are only computed for
+    four or more prices.
+    """
+    n = prices.size
+    mid = n // 2
+    kth = {0, mid, n - 1}
+    if n % 2 == 0:
+        kth.add(mid - 1)
+
+    # (index, weight) of the upper neighbour for each interpolated quartile
+    quartile_points: list[tuple[int, int]] = []
+    if n >= 4:
+        m = n + 1
+        for i in (1, 3):
+            j = min(max(i * m // 4, 1), n - 1)
+            quartile_points.append((j, i * m - j * 4))
+            kth.update((j - 1, j))
+
+    part = np.partition(prices, sorted(kth))
+    if n % 2:
+        median_price = int(part[mid])
+    else:
+        median_price = int((int(part[mid - 1]) + int(part[mid])) / 2)
+
+    quartiles = [
+        int((int(part[j - 1]) * (4 - delta) + int(part[j]) * delta) / 4)
+        for j, delta in quartile_points
+    ]
+    percentile_25, percentile_75 = quartiles or (None, None)
+    return int(part[0]), int(part[n - 1]), median_price, percentile_25, percentile_75
+
+
 class GetPriceDistributionInput(BaseModel):
     """Input schema for the get_price_distribution tool."""
 
@@ -117,8 +184,8 @@ class GetPriceDistributionTool:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": self.input_model.model_json_schema(),
-            "outputSchema": self.output_model.model_json_schema(),
+            "inputSchema": json_schema(self.input_model),
+            "outputSchema": json_schema(self.output_model),
         }
 
     async def invoke(self, raw_arguments: dict | None) -> dict[str, Any]:
@@ -141,17 +208,21 @@ class GetPriceDistributionTool:
         if payload.classification:
             params_base["priceClassification"] = payload.classification
 
-        for year in range(payload.from_year, payload.to_year + 1):
-            params = params_base.copy()
-            params["year"] = str(year)
-
-            fetch_result = await self._http_client.fetch(
-                "XIT001",
-                params=params,
-                response_format="json",
-                force_refresh=payload.force_refresh,
+        # Years are independent requests; fetch them concurrently. The HTTP
+        # client's semaphore keeps the number of in-flight requests bounded.
+        results = await asyncio.gather(
+            *(
+                self._http_client.fetch(
+                    "XIT001",
+                    params={**params_base, "year": str(year)},
+                    response_format="json",
+                    force_refresh=payload.force_refresh,
+                )
+                for year in range(payload.from_year, payload.to_year + 1)
             )
+        )
 
+        for fetch_result in results:
             year_data = fetch_result.data
             if isinstance(year_data, dict):
                 if "data" in year_data and isinstance(year_data["data"], list):
@@ -159,39 +230,24 @@ class GetPriceDistributionTool:
             elif isinstance(year_data, list):
                 all_data.extend(year_data)
 
-        # Extract prices
-        prices: list[int] = []
-        for record in all_data:
-            price_str = record.get("TradePrice")
-            if price_str:
-                try:
-                    prices.append(int(price_str))
-                except (ValueError, TypeError):
-                    pass
-
-        record_count = len(prices)
+        # Extract prices into a packed array for the vectorized stats below
+        prices = _trade_prices(all_data)
+
+        record_count = int(prices.size)
         if record_count == 0:
-            return GetPriceDistributionResponse(
-                totalCount=0,
+            return GetPriceDistributionResponse.model_construct(
+                total_count=0,
                 bins=[],
             )
 
-        prices.sort()
-        min_price = prices[0]
-        max_price = prices[-1]
-
-        # Calculate percentiles
-        percentile_25 = None
-        percentile_75 = None
-        median_price = int(median(prices))
-
-        if record_count >= 4:
-            try:
-                q = quantiles(prices, n=4)
-                percentile_25 = int(q[0])
-                percentile_75 = int(q[2])
-            except Exception:
-                pass  # Fallback if quantiles fails
+        # Calculate min/max, median and percentiles
+        (
+            min_price,
+            max_price,
+            median_price,
+            percentile_25,
+            percentile_75,
+        ) = _order_stats(prices)
 
         # Generate bins
         price_range = max_price - min_price
@@ -201,47 +257,40 @@ class GetPriceDistributionTool:
             # All prices equal
             bin_size = 1
             num_bins = 1
+            bin_counts = [record_count]
         else:
             bin_size = price_range / num_bins
-
-        bin_counts = [0] * num_bins
-
-        for price in prices:
-            if price_range == 0:
-                bin_counts[0] += 1
-                continue
-
-            idx = int((price - min_price) / bin_size)
-            if idx >= num_bins:
-                idx = num_bins - 1
-            bin_counts[idx] += 1
-
-        bins: list[PriceBin] = []
-        cumulative_count = 0
-
-        for i in range(num_bins):
-            bin_min = int(min_price + i * bin_size)
-            bin_max = int(min_price + (i + 1) * bin_size)
-            # Ensure last bin max matches max_price exactly for display
-            if i == num_bins - 1:
-                bin_max = max_price
-
-            count = bin_counts[i]
-            cumulative_count += count
-            cumulative_percent = round((cumulative_count / record_count) * 100, 1)
-
-            # Format label (in 万円)
-            label = f"{bin_min // 10000}万〜{bin_max // 10000}万"
-
-            bins.append(
-                PriceBin(
-                    minValue=bin_min,
-                    maxValue=bin_max,
-                    label=label,
-                    count=count,
-                    cumulativePercent=cumulative_percent,
-                )
+            # floor((price - min_price) / bin_size) in exact integer
+            # arithmetic, so no price lands in a neighbouring bin through
+            # float rounding; the maximum is folded into the last bin.
+            idx = prices - min_price
+            idx *= num_bins
+            idx //= price_range
+            np.minimum(idx, num_bins - 1, out=idx)
+            bin_counts = np.bincount(idx, minlength=num_bins).tolist()
+
+        # Bin edges, truncated like int(min_price + i * bin_size); the last
+        # edge matches max_price exactly for display.
+        edges = (min_price + np.arange(num_bins + 1) * bin_size).astype(np.int64)
+        edges[-1] = max_price
+        edge_values = edges.tolist()
+        # Edge labels are in 万円
+        edge_labels = [f"{edge // 10000}万" for edge in edge_values]
+        cumulative_counts = np.cumsum(bin_counts).tolist()
+
+        # Bin values are plain ints/floats computed above, so skip validation
+        bins = [
+            PriceBin.model_construct(
+                min_value=edge_values[i],
+                max_value=edge_values[i + 1],
+                label=f"{edge_labels[i]}〜{edge_labels[i + 1]}",
+                count=bin_counts[i],
+                cumulative_percent=round(
+                    (cumulative_counts[i] / record_count) * 100, 1
+                ),
             )
+            for i in range(num_bins)
+        ]
 
         logger.info(
             "get_price_distribution",
@@ -254,13 +303,15 @@ class GetPriceDistributionTool:
             },
         )
 
-        return GetPriceDistributionResponse(
-            totalCount=record_count,
-            minPrice=min_price,
-            maxPrice=max_price,
-            percentile25=percentile_25,
-            percentile50=median_price,
-            percentile75=percentile_75,
+        # Every value is an int (or None) computed above and the bins are
+        # already PriceBin instances, so skip re-validation.
+        return GetPriceDistributionResponse.model_construct(
+            total_count=record_count,
+            min_price=min_price,
+            max_price=max_price,
+            percentile_25=percentile_25,
+            percentile_50=median_price,
+            percentile_75=percentile_75,
             bins=bins,
         )
 
@@ -3,13 +3,34 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import math
+import os
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
 
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - exercised only without pybase64
+    pybase64 = None  # type: ignore[assignment]
+
+# Below this size pybase64's dispatch and setup cost more than the SIMD
+# encoding saves, so tiny tiles stay on the stdlib encoder.
+PYBASE64_MIN_BYTES = 96
+
+
+@lru_cache(maxsize=4096)
 def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> tuple[int, int]:
     """
     Convert latitude/longitude to tile coordinates (Web Mercator projection).
 
+    Results are memoized, since the location tools are typically called
+    several times for the same coordinates.
+
     Args:
         lat: Latitude in degrees
         lon: Longitude in degrees
@@ -25,6 +46,63 @@ def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> tuple[int, int]:
     return (tile_x, tile_y)
 
 
+def lat_lon_to_tile_batch(
+    lats: npt.ArrayLike, lons: npt.ArrayLike, zoom: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert many latitude/longitude pairs to tile coordinates at once.
+
+    Uses the same Web Mercator formula as lat_lon_to_tile, evaluated with
+    NumPy ufuncs over whole arrays. Single points are better served by the
+    memoized scalar version.
+
+    Args:
+        lats: Latitudes in degrees
+        lons: Longitudes in degrees
+        zoom: Zoom level (0-18, typically 11-15 for MLIT APIs)
+
+    Returns:
+        Tuple of (tile_x, tile_y) int32 arrays
+    """
+    n = 2.0**zoom
+    lons = np.asarray(lons, dtype=np.float64)
+    lat_rad = np.radians(np.asarray(lats, dtype=np.float64))
+    tile_x = ((lons + 180.0) / 360.0 * n).astype(np.int32)
+    tile_y = ((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * n).astype(np.int32)
+    return tile_x, tile_y
+
+
+def tile_to_bbox(
+    zoom: int, tile_x: int, tile_y: int
+) -> tuple[float, float, float, float]:
+    """
+    Convert tile coordinates to the tile's geographic bounds.
+
+    Args:
+        zoom: Zoom level
+        tile_x: Tile X coordinate
+        tile_y: Tile Y coordinate
+
+    Returns:
+        Tuple of (min_lon, min_lat, max_lon, max_lat)
+    """
+    n = 2.0**zoom
+    min_lon = tile_x / n * 360.0 - 180.0
+    max_lon = (tile_x + 1) / n * 360.0 - 180.0
+    max_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+    min_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (tile_y + 1) / n))))
+    return (min_lon, min_lat, max_lon, max_lat)
+
+
+def _bbox_tile_ranges(
+    min_lat: float, min_lon: float, max_lat: float, max_lon: float, zoom: int
+) -> tuple[range, range]:
+    """Return the tile x and y ranges covering a bounding box."""
+    min_tile_x, max_tile_y = lat_lon_to_tile(min_lat, min_lon, zoom)
+    max_tile_x, min_tile_y = lat_lon_to_tile(max_lat, max_lon, zoom)
+    return range(min_tile_x, max_tile_x + 1), range(min_tile_y, max_tile_y + 1)
+
+
 def bbox_to_tiles(
     min_lat: float, min_lon: float, max_lat: float, max_lon: float, zoom: int
 ) -> list[tuple[int, int]]:
@@ -39,17 +117,39 @@ def bbox_to_tiles(
         zoom: Zoom level
 
     Returns:
-        List of (tile_x, tile_y) tuples
+        List of (tile_x, tile_y) tuples, ordered by x then y
     """
-    min_tile_x, max_tile_y = lat_lon_to_tile(min_lat, min_lon, zoom)
-    max_tile_x, min_tile_y = lat_lon_to_tile(max_lat, max_lon, zoom)
+    xs, ys = _bbox_tile_ranges(min_lat, min_lon, max_lat, max_lon, zoom)
+    # product() builds the tuples in C, in the same x-major order
+    return list(product(xs, ys))
 
-    tiles = []
-    for x in range(min_tile_x, max_tile_x + 1):
-        for y in range(min_tile_y, max_tile_y + 1):
-            tiles.append((x, y))
 
-    return tiles
+def bbox_to_tiles_array(
+    min_lat: float, min_lon: float, max_lat: float, max_lon: float, zoom: int
+) -> np.ndarray:
+    """
+    Convert bounding box to an array of tile coordinates covering the area.
+
+    Same tiles and order as bbox_to_tiles, for callers that work on arrays
+    and would otherwise pay for one tuple per tile.
+
+    Args:
+        min_lat: Minimum latitude
+        min_lon: Minimum longitude
+        max_lat: Maximum latitude
+        max_lon: Maximum longitude
+        zoom: Zoom level
+
+    Returns:
+        (N, 2) int32 array of (tile_x, tile_y) rows
+    """
+    xs, ys = _bbox_tile_ranges(min_lat, min_lon, max_lat, max_lon, zoom)
+    grid_x, grid_y = np.meshgrid(
+        np.arange(xs.start, xs.stop, dtype=np.int32),
+        np.arange(ys.start, ys.stop, dtype=np.int32),
+        indexing="ij",
+    )
+    return np.stack([grid_x.ravel(), grid_y.ravel()], axis=1)
 
 
 def encode_mvt_to_base64(content: bytes) -> str:
@@ -62,7 +162,73 @@ def encode_mvt_to_base64(content: bytes) -> str:
     Returns:
         Base64-encoded string
     """
-    return base64.b64encode(content).decode("ascii")
+    if not content:
+        # Empty tiles are common for areas without data
+        return ""
+    if pybase64 is not None and len(content) >= PYBASE64_MIN_BYTES:
+        # SIMD-accelerated encoder from the optional speedups extra
+        return pybase64.b64encode(content).decode("ascii")
+    # b2a_base64 is the primitive behind b64encode; calling it directly with
+    # newline=False skips the extra copy b64encode makes to strip the newline.
+    return binascii.b2a_base64(content, newline=False).decode("ascii")
+
+
+def read_tile_file(
+    path: Path, want_content: bool, max_bytes: int
+) -> tuple[int, bytes | None]:
+    """
+    Return a cached tile's size and, if wanted and small enough, its bytes.
+
+    The size comes from fstat on the open handle, so the file is opened once
+    and tiles larger than ``max_bytes`` (served as resource URIs) are never
+    read.
+
+    Args:
+        path: Path of the cached tile file
+        want_content: Whether the caller needs the file contents
+        max_bytes: Largest file whose contents are returned
+
+    Returns:
+        Tuple of (size in bytes, contents or None)
+    """
+    with path.open("rb") as fh:
+        size_bytes = os.fstat(fh.fileno()).st_size
+        if not want_content or size_bytes > max_bytes:
+            return size_bytes, None
+        return size_bytes, fh.read()
+
+
+def encode_file_to_base64(path: Path, chunk_size: int = 3 * 64 * 1024) -> str:
+    """
+    Encode a file's contents to a base64 string without reading it whole.
+
+    The file is encoded in chunks whose size is a multiple of 3, so each
+    chunk maps to complete base64 quads and no padding appears mid-stream.
+
+    Args:
+        path: Path of the binary MVT/PBF file
+        chunk_size: Bytes read per chunk (must be a multiple of 3)
+
+    Returns:
+        Base64-encoded string
+    """
+    if chunk_size <= 0 or chunk_size % 3:
+        raise ValueError("chunk_size must be a positive multiple of 3")
+
+    with path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        encoded = bytearray(-(-size // 3) * 4)
+        pos = 0
+        while chunk := fh.read(chunk_size):
+            if pybase64 is not None:
+                piece = pybase64.b64encode(chunk)
+            else:
+                piece = binascii.b2a_base64(chunk, newline=False)
+            encoded[pos : pos + len(piece)] = piece
+            pos += len(piece)
+    # Trim in place in case the file shrank while it was being read
+    del encoded[pos:]
+    return encoded.decode("ascii")
 
 
 def decode_base64_to_mvt(encoded: str) -> bytes:
@@ -75,12 +241,18 @@ def decode_base64_to_mvt(encoded: str) -> bytes:
     Returns:
         Binary MVT/PBF data
     """
+    if pybase64 is not None:
+        return pybase64.b64decode(encoded)
     return base64.b64decode(encoded)
 
 
 __all__ = [
     "encode_mvt_to_base64",
+    "encode_file_to_base64",
     "decode_base64_to_mvt",
     "lat_lon_to_tile",
+    "lat_lon_to_tile_batch",
+    "tile_to_bbox",
     "bbox_to_tiles",
+    "bbox_to_tiles_array",
 ]
@@ -7,7 +7,6 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    ValidationError,
     field_validator,
 )
 
@@ -158,10 +157,14 @@ class ListMunicipalitiesTool:
             )
             if not code or not name:
                 continue
-            try:
-                municipalities.append(Municipality(code=str(code), name=str(name)))
-            except ValidationError:
+            code = str(code)
+            # Same constraint as Municipality.code; checking it here lets the
+            # entry be built without running the model validator per record.
+            if len(code) != 5:
                 continue
+            municipalities.append(
+                Municipality.model_construct(code=code, name=str(name))
+            )
 
         if not municipalities:
             raise ValueError(
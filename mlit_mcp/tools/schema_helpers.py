@@ -0,0 +1,17 @@
+"""Helpers for publishing tool input/output JSON schemas."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON schema of ``model``, generated once and then shared."""
+    return model.model_json_schema()
+
+
+__all__ = ["json_schema"]
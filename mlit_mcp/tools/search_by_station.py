@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import json
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mlit_mcp import json_codec
 from mlit_mcp.http_client import MLITHttpClient
 from .gis_helpers import lat_lon_to_tile
 
 logger = logging.getLogger(__name__)
 
 
+def _find_station(
+    features: Iterable[dict[str, Any]], needle: str
+) -> tuple[list[float], str] | None:
+    """Return (coordinates, name) of the first station containing ``needle``."""
+    for f in features:
+        props = f.get("properties", {})
+        name = props.get("S12_001_ja", "")
+        if needle in name.lower():
+            coords = f.get("geometry", {}).get("coordinates", [])
+            if coords:
+                return coords, name
+    return None
+
+
 class SearchByStationInput(BaseModel):
     """Input schema for the search_by_station tool."""
 
@@ -122,89 +137,28 @@ class SearchByStationTool:
                 "y": y,
             }
 
-            fetch_result = await self._http_client.fetch(
-                "XKT015",
-                params=station_params,
-                response_format="geojson",
-                force_refresh=payload.force_refresh,
+            needle = payload.station_name.lower()
+            match = await self._search_tile(
+                station_params, needle, payload.force_refresh
             )
 
-            data = fetch_result.data
-            if data is None and fetch_result.file_path:
-                try:
-                    content = fetch_result.file_path.read_bytes()
-                    data = json.loads(content)
-                except Exception as ex:
-                    logger.error(f"Failed to parse: {ex}")
-                    data = {}
-
-            data = data or {}
-            features = data.get("features", [])
-
-            # Find matching station (case-insensitive)
-            for f in features:
-                props = f.get("properties", {})
-                geom = f.get("geometry", {})
-                name = props.get("S12_001_ja", "")
-
-                if payload.station_name.lower() in name.lower():
-                    coords = geom.get("coordinates", [])
-                    if coords:
-                        station_coords = coords
-                        summary.append(f"Found station: {name}")
-                        break
-
-            if not station_coords:
+            if not match:
                 # Retry on neighboring tiles (3x3) around default tile
-                found = False
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        params = {
-                            "response_format": "geojson",
-                            "z": Z,
-                            "x": x + dx,
-                            "y": y + dy,
-                        }
-                        neighbor_result = await self._http_client.fetch(
-                            "XKT015",
-                            params=params,
-                            response_format="geojson",
-                            force_refresh=payload.force_refresh,
-                        )
-                        ndata = neighbor_result.data
-                        if ndata is None and neighbor_result.file_path:
-                            try:
-                                content = neighbor_result.file_path.read_bytes()
-                                ndata = json.loads(content)
-                            except Exception:
-                                ndata = {}
-                        ndata = ndata or {}
-                        for f in ndata.get("features", []):
-                            props = f.get("properties", {})
-                            geom = f.get("geometry", {})
-                            name = props.get("S12_001_ja", "")
-                            if payload.station_name.lower() in name.lower():
-                                coords = geom.get("coordinates", [])
-                                if coords:
-                                    station_coords = coords
-                                    summary.append(f"Found station: {name}")
-                                    found = True
-                                    break
-                        if found:
-                            break
-                    if found:
-                        break
-
-                if not station_coords:
-                    summary.append(f"Station '{payload.station_name}' not found.")
-                    return SearchByStationResponse(
-                        stationName=payload.station_name,
-                        stationCoords=None,
-                        transactions=[],
-                        summary=summary,
-                    )
+                match = await self._search_neighbors(
+                    Z, x, y, needle, payload.force_refresh
+                )
+
+            if not match:
+                summary.append(f"Station '{payload.station_name}' not found.")
+                return SearchByStationResponse(
+                    stationName=payload.station_name,
+                    stationCoords=None,
+                    transactions=[],
+                    summary=summary,
+                )
+
+            station_coords, name = match
+            summary.append(f"Found station: {name}")
 
             # Step 2: Fetch transactions for the area
             # Get prefecture code - simplified for demo
@@ -244,6 +198,70 @@ class SearchByStationTool:
             summary=summary,
         )
 
+    async def _search_tile(
+        self, params: dict[str, Any], needle: str, force_refresh: bool
+    ) -> tuple[list[float], str] | None:
+        """Fetch one XKT015 tile and look for a station matching ``needle``."""
+        fetch_result = await self._http_client.fetch(
+            "XKT015",
+            params=params,
+            response_format="geojson",
+            force_refresh=force_refresh,
+            parse=True,
+        )
+
+        if fetch_result.data is not None:
+            return _find_station(fetch_result.data.get("features", []), needle)
+        if not fetch_result.file_path:
+            return None
+
+        # Cached tiles are streamed on a worker thread with the faster JSON
+        # codec; the scan stops parsing as soon as a station matches.
+        try:
+            return await json_codec.run_parser(
+                _find_station, json_codec.iter_features(fetch_result.file_path), needle
+            )
+        except Exception as ex:
+            logger.error(f"Failed to parse: {ex}")
+            return None
+
+    async def _search_neighbors(
+        self, z: int, x: int, y: int, needle: str, force_refresh: bool
+    ) -> tuple[list[float], str] | None:
+        """Search the 8 tiles around z/x/y for a station matching ``needle``.
+
+        The tiles are fetched concurrently, but matches are taken in the
+        fixed scan order so the result does not depend on which tile arrives
+        first. Tiles still in flight are cancelled once one matches.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._search_tile(
+                    {
+                        "response_format": "geojson",
+                        "z": z,
+                        "x": x + dx,
+                        "y": y + dy,
+                    },
+                    needle,
+                    force_refresh,
+                )
+            )
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            if dx or dy
+        ]
+        try:
+            for task in tasks:
+                match = await task
+                if match:
+                    return match
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
 
 __all__ = [
     "SearchByStationInput",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from collections import defaultdict
@@ -151,25 +152,42 @@ class SummarizeTransactionsTool:
         if payload.classification:
             params_base["priceClassification"] = payload.classification
 
-        for year in range(payload.from_year, payload.to_year + 1):
-            params = params_base.copy()
-            params["year"] = str(year)
-
-            fetch_result = await self._http_client.fetch(
-                "XIT001",
-                params=params,
-                response_format="json",
-                force_refresh=payload.force_refresh,
-            )
-            fetch_results.append(fetch_result)
+        # Years are independent requests; fetch them concurrently. The HTTP
+        # client's semaphore keeps the number of in-flight requests bounded.
+        years = range(payload.from_year, payload.to_year + 1)
+        results = await asyncio.gather(
+            *(
+                self._http_client.fetch(
+                    "XIT001",
+                    params={**params_base, "year": str(year)},
+                    response_format="json",
+                    force_refresh=payload.force_refresh,
+                )
+                for year in years
+            ),
+            return_exceptions=True,
+        )
 
-            year_data = fetch_result.data
+        # A failed year is logged and left out of the summary; the call only
+        # fails if no year could be fetched at all.
+        errors: list[BaseException] = []
+        for year, result in zip(years, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to fetch transactions for {year}: {result}")
+                errors.append(result)
+                continue
+            fetch_results.append(result)
+
+            year_data = result.data
             if isinstance(year_data, dict):
                 if "data" in year_data and isinstance(year_data["data"], list):
                     all_data.extend(year_data["data"])
             elif isinstance(year_data, list):
                 all_data.extend(year_data)
 
+        if errors and not fetch_results:
+            raise errors[0]
+
         # Aggregate statistics
         prices = []
         areas = []  # For price per sqm
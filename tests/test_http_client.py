@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
+from mlit_mcp import json_codec
 from mlit_mcp.cache import BinaryFileCache, InMemoryTTLCache
 from mlit_mcp.http_client import MLITHttpClient
 
@@ -106,3 +110,96 @@ async def test_fetch_geojson_uses_file_cache(
 
     # Only 1 request actually sent
     assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.anyio
+async def test_fetch_geojson_parse_returns_data_on_miss(
+    monkeypatch, tmp_path, httpx_mock: HTTPXMock
+):
+    monkeypatch.setenv("MLIT_API_KEY", "dummy")
+
+    body = b'{"type":"FeatureCollection","features":[{"properties":{"a":1}}]}'
+    httpx_mock.add_response(status_code=200, content=body)
+
+    client = MLITHttpClient(
+        base_url="https://example.test/",
+        json_cache=InMemoryTTLCache(maxsize=4, ttl=60),
+        file_cache=BinaryFileCache(tmp_path / "bin"),
+    )
+
+    result = await client.fetch(
+        "XKT013", params={"z": 14}, response_format="geojson", parse=True
+    )
+    assert result.data == {
+        "type": "FeatureCollection",
+        "features": [{"properties": {"a": 1}}],
+    }
+    assert result.file_path is not None
+    assert result.file_path.read_bytes() == body
+    assert result.size_bytes == len(body)
+
+    # The body was decoded through run_parser, off the event loop
+    assert json_codec._PARSE_LIMITER.get() is not None
+
+    # Cache hits leave parsing to the caller
+    cached = await client.fetch(
+        "XKT013", params={"z": 14}, response_format="geojson", parse=True
+    )
+    assert cached.from_cache is True
+    assert cached.data is None
+    assert cached.file_path == result.file_path
+    assert cached.size_bytes is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_bounded(monkeypatch, tmp_path):
+    monkeypatch.setenv("MLIT_API_KEY", "dummy")
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    client = MLITHttpClient(
+        base_url="https://example.test/",
+        json_cache=InMemoryTTLCache(maxsize=16, ttl=60),
+        file_cache=BinaryFileCache(tmp_path / "bin"),
+        max_concurrency=2,
+        transport=httpx.MockTransport(handler),
+    )
+
+    await asyncio.gather(
+        *(
+            client.fetch("XIT001", params={"year": str(year)})
+            for year in range(2015, 2021)
+        )
+    )
+
+    assert client.max_concurrency == 2
+    assert peak == 2
+
+
+@pytest.mark.anyio
+async def test_fetch_json_decodes_utf8_body(
+    monkeypatch, tmp_path, httpx_mock: HTTPXMock
+):
+    monkeypatch.setenv("MLIT_API_KEY", "dummy")
+    body = '{"status":"OK","data":[{"Municipality":"千代田区"}]}'.encode("utf-8")
+    httpx_mock.add_response(status_code=200, content=body)
+
+    client = MLITHttpClient(
+        base_url="https://example.test/",
+        json_cache=InMemoryTTLCache(maxsize=4, ttl=60),
+        file_cache=BinaryFileCache(tmp_path / "bin"),
+    )
+
+    result = await client.fetch("XIT001", params={"year": "2020"})
+
+    assert result.data == {"status": "OK", "data": [{"Municipality": "千代田区"}]}
+    assert result.size_bytes == len(body)
@@ -0,0 +1,76 @@
+import pytest
+
+from mlit_mcp import json_codec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    return json_codec
+
+
+def test_round_trip(codec):
+    value = {"name": "東京駅", "count": 3, "coords": [139.7671, 35.6812]}
+    encoded = codec.dumps(value)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == value
+
+
+def test_dumps_is_compact_utf8(codec):
+    assert codec.dumps({"a": "駅"}) == '{"a":"駅"}'.encode("utf-8")
+
+
+def test_loads_accepts_str_and_memoryview(codec):
+    assert codec.loads('{"a": 1}') == {"a": 1}
+    assert codec.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_iter_features_reads_feature_collection(tmp_path, monkeypatch, streaming):
+    if not streaming:
+        monkeypatch.setattr(json_codec, "ijson", None)
+    elif json_codec.ijson is None:
+        pytest.skip("ijson is not installed")
+    else:
+        monkeypatch.setattr(json_codec, "STREAM_MIN_BYTES", 0)
+
+    path = tmp_path / "tile.geojson"
+    path.write_bytes(
+        b'{"type":"FeatureCollection","features":['
+        b'{"properties":{"PTN_2020":12.5}},{"properties":{"MESH_ID":"a"}}]}'
+    )
+
+    features = list(json_codec.iter_features(path))
+
+    assert features == [
+        {"properties": {"PTN_2020": 12.5}},
+        {"properties": {"MESH_ID": "a"}},
+    ]
+    assert isinstance(features[0]["properties"]["PTN_2020"], float)
+
+
+def test_iter_features_parses_small_files_whole(tmp_path, monkeypatch):
+    if json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    class NoStreaming:
+        @staticmethod
+        def items(*args, **kwargs):
+            raise AssertionError("small files should not be streamed")
+
+    monkeypatch.setattr(json_codec, "ijson", NoStreaming)
+    path = tmp_path / "tile.geojson"
+    path.write_bytes(b'{"type":"FeatureCollection","features":[{"id":1}]}')
+
+    assert list(json_codec.iter_features(path)) == [{"id": 1}]
+
+
+@pytest.mark.anyio
+async def test_run_parser_reuses_limiter_per_event_loop():
+    assert await json_codec.run_parser(json_codec.loads, b"[1, 2]") == [1, 2]
+    limiter = json_codec._PARSE_LIMITER.get()
+    await json_codec.run_parser(json_codec.loads, b"{}")
+    assert json_codec._PARSE_LIMITER.get() is limiter
@@ -283,3 +283,55 @@ async def test_detect_outliers_stats_after_exclusion(tool, mock_http_client):
     # After excluding outliers, average should be around 100M
     if result.avg_after_exclusion:
         assert result.avg_after_exclusion < 200000000
+
+
+@pytest.mark.asyncio
+async def test_detect_outliers_prices_beyond_int32(tool, mock_http_client):
+    """Prices above the int32 range are kept exact."""
+    prices = [str(100000000 + i * 10000000) for i in range(8)] + ["5000000000"]
+    mock_data = [
+        {"TradePrice": p, "Type": "宅地(土地)", "Period": "2020年第1四半期"}
+        for p in prices
+    ]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    input_data = DetectOutliersInput(
+        fromYear=2020,
+        toYear=2020,
+        area="13103",
+        method=OutlierMethod.IQR,
+    )
+
+    result = await tool.run(input_data)
+
+    assert result.total_count == 9
+    assert [o.price for o in result.outliers] == [5000000000]
+    assert result.avg_before_exclusion == 675555555
+    assert result.avg_after_exclusion == 135000000
+
+
+@pytest.mark.asyncio
+async def test_detect_outliers_skips_prices_beyond_int64(tool, mock_http_client):
+    """A price that does not fit in int64 is skipped, not fatal."""
+    prices = ["100000000", "200000000", str(2**63)]
+    mock_data = [
+        {"TradePrice": p, "Type": "宅地(土地)", "Period": "2020年第1四半期"}
+        for p in prices
+    ]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    input_data = DetectOutliersInput(
+        fromYear=2020,
+        toYear=2020,
+        area="13103",
+        method=OutlierMethod.IQR,
+    )
+
+    result = await tool.run(input_data)
+
+    assert result.total_count == 2
+    assert result.avg_before_exclusion == 150000000
@@ -1,5 +1,7 @@
 """Tests for fetch_population_trend tool."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -99,6 +101,45 @@ class TestFetchPopulationTrendTool:
         assert isinstance(result, FetchPopulationTrendResponse)
         assert len(result.mesh_data) == 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_from_cached_file(self, tool, mock_http_client, tmp_path):
+        """Test reading features from a cached GeoJSON file."""
+        path = tmp_path / "tile.geojson"
+        path.write_text(
+            json.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "properties": {
+                                "MESH_ID": "a",
+                                "PTN_2020": 100,
+                                "PTN_2050": 80,
+                            }
+                        },
+                        {
+                            "properties": {
+                                "MESH_ID": "b",
+                                "PTN_2020": 300,
+                                "PTN_2050": 240,
+                            }
+                        },
+                    ],
+                }
+            )
+        )
+        mock_http_client.fetch.return_value = MagicMock(data=None, file_path=path)
+
+        input_data = FetchPopulationTrendInput(
+            latitude=35.6812,
+            longitude=139.7671,
+        )
+        result = await tool.run(input_data)
+
+        assert [m["mesh_id"] for m in result.mesh_data] == ["a", "b"]
+        assert result.mesh_data[1]["population_by_year"] == {"2020": 300, "2050": 240}
+        assert "decrease of 20.0%" in result.summary[1]
+
     @pytest.mark.asyncio
     async def test_api_error_handling(self, tool, mock_http_client):
         """Test handling of API errors."""
@@ -119,3 +160,11 @@ class TestFetchPopulationTrendTool:
         assert descriptor["name"] == "mlit.fetch_population_trend"
         assert "description" in descriptor
         assert "inputSchema" in descriptor
+
+    def test_descriptor_reuses_schemas(self, tool, mock_http_client):
+        """Schemas are generated once and shared across descriptor() calls."""
+        first = tool.descriptor()
+        second = FetchPopulationTrendTool(mock_http_client).descriptor()
+        assert second["inputSchema"] is first["inputSchema"]
+        assert second["outputSchema"] is first["outputSchema"]
+        assert first["inputSchema"] == FetchPopulationTrendInput.model_json_schema()
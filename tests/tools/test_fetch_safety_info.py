@@ -173,6 +173,29 @@ class TestFetchSafetyInfoTool:
         assert isinstance(result, FetchSafetyInfoResponse)
         assert any("Failed" in s or "Error" in s for s in result.summary)
 
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_other_types(self, tool, mock_http_client):
+        """A failing dataset does not discard results from the others."""
+
+        async def fake_fetch(dataset_id, **kwargs):
+            if dataset_id == "XKT038":
+                raise Exception("API Error")
+            return MagicMock(
+                data={"features": [{"properties": {"id": dataset_id}}]},
+                file_path=None,
+            )
+
+        mock_http_client.fetch.side_effect = fake_fetch
+
+        input_data = FetchSafetyInfoInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        assert result.safety_info["tsunami"] == [{"id": "XKT037"}]
+        assert result.safety_info["storm_surge"] == []
+        assert result.safety_info["shelter"] == [{"id": "XKT016"}]
+        assert result.summary[0] == "Found 1 tsunami records."
+        assert result.summary[1].startswith("Failed to fetch storm_surge")
+
     def test_descriptor(self, tool):
         """Test tool descriptor."""
         descriptor = tool.descriptor()
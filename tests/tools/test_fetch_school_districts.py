@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock
 from pydantic import ValidationError
@@ -142,6 +144,27 @@ class TestFetchSchoolDistrictsTool:
         assert result.mvt_base64 is None
         assert result.meta.format == "geojson"
 
+    @pytest.mark.anyio
+    async def test_geojson_from_cached_file(
+        self, tool, mock_http_client, sample_geojson, tmp_path
+    ):
+        """GeoJSON tiles cached on disk are read and sized in one pass."""
+        geojson_file = tmp_path / "tile.geojson"
+        geojson_file.write_text(json.dumps(sample_geojson))
+
+        mock_http_client.fetch.return_value = FetchResult(
+            data=None,
+            file_path=geojson_file,
+            from_cache=True,
+        )
+
+        payload = FetchSchoolDistrictsInput(z=11, x=1819, y=806)
+        result = await tool.run(payload)
+
+        assert result.geojson == sample_geojson
+        assert result.meta.size_bytes == geojson_file.stat().st_size
+        assert result.meta.is_resource is False
+
     @pytest.mark.anyio
     async def test_with_admin_code(self, tool, mock_http_client, tmp_path):
         """Test request with administrative area code parameter."""
@@ -1,8 +1,11 @@
 """Tests for fetch_station_stats tool."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from mlit_mcp.tools import fetch_station_stats
 from mlit_mcp.tools.fetch_station_stats import (
     FetchStationStatsInput,
     FetchStationStatsResponse,
@@ -94,6 +97,87 @@ class TestFetchStationStatsTool:
         assert len(result.stations) > 0
         assert result.stations[0]["station_name"] == "東京駅"
 
+    @pytest.mark.asyncio
+    async def test_cached_file_is_parsed_once(
+        self, tool, mock_http_client, tmp_path, monkeypatch
+    ):
+        """Repeat queries against the same cached tile reuse parsed stations."""
+        tile = tmp_path / "stations.geojson"
+
+        def write_tile(name):
+            tile.write_text(
+                json.dumps(
+                    {
+                        "type": "FeatureCollection",
+                        "features": [
+                            {
+                                "properties": {"S12_001_ja": name, "S12_057": "10"},
+                                "geometry": {"coordinates": [139.7, 35.6]},
+                            }
+                        ],
+                    }
+                )
+            )
+
+        write_tile("新宿駅")
+        mock_http_client.fetch.return_value = MagicMock(data=None, file_path=tile)
+
+        parsed = []
+        loads = fetch_station_stats.json_codec.loads
+        monkeypatch.setattr(
+            fetch_station_stats.json_codec,
+            "loads",
+            lambda content: parsed.append(content) or loads(content),
+        )
+
+        input_data = FetchStationStatsInput(latitude=35.6812, longitude=139.7671)
+        first = await tool.run(input_data)
+        second = await tool.run(input_data)
+
+        assert len(parsed) == 1
+        assert second.stations == first.stations
+        assert first.stations[0]["passenger_count"] == 10
+
+        # A refreshed tile file invalidates the memoized stations
+        write_tile("新宿三丁目駅")
+        third = await tool.run(input_data)
+
+        assert len(parsed) == 2
+        assert third.stations[0]["station_name"] == "新宿三丁目駅"
+
+    @pytest.mark.asyncio
+    async def test_memoized_stations_are_not_shared(
+        self, tool, mock_http_client, tmp_path
+    ):
+        """Mutating returned records does not leak into later calls."""
+        tile = tmp_path / "stations.geojson"
+        tile.write_text(
+            json.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "properties": {"S12_001_ja": "新宿駅"},
+                            "geometry": {
+                                "coordinates": [[139.70, 35.69], [139.71, 35.69]]
+                            },
+                        }
+                    ],
+                }
+            )
+        )
+        mock_http_client.fetch.return_value = MagicMock(data=None, file_path=tile)
+
+        input_data = FetchStationStatsInput(latitude=35.6812, longitude=139.7671)
+        first = await tool.invoke({"latitude": 35.6812, "longitude": 139.7671})
+        first["stations"][0]["station_name"] = "changed"
+        first["stations"][0]["coordinates"][0][0] = 0.0
+
+        second = await tool.run(input_data)
+
+        assert second.stations[0]["station_name"] == "新宿駅"
+        assert second.stations[0]["coordinates"] == [[139.70, 35.69], [139.71, 35.69]]
+
     @pytest.mark.asyncio
     async def test_fetch_empty_results(self, tool, mock_http_client):
         """Test fetching with no stations found."""
@@ -111,6 +195,136 @@ class TestFetchStationStatsTool:
         assert isinstance(result, FetchStationStatsResponse)
         assert len(result.stations) == 0
 
+    @pytest.mark.asyncio
+    async def test_large_station_list_returned_as_resource(
+        self, tool, mock_http_client, tmp_path, monkeypatch
+    ):
+        """Station lists over the threshold are saved and returned by URI."""
+        mock_http_client.fetch.return_value = MagicMock(
+            data={
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "properties": {"S12_001_ja": f"駅{i}", "S12_057": "100"},
+                        "geometry": {"coordinates": [139.7, 35.6]},
+                    }
+                    for i in range(5)
+                ],
+            },
+            file_path=None,
+        )
+        saved = tmp_path / "stations.json"
+
+        def save_to_cache(key, content, suffix):
+            saved.write_bytes(content)
+            return saved
+
+        mock_http_client.save_to_cache = save_to_cache
+        monkeypatch.setattr(fetch_station_stats, "RESOURCE_THRESHOLD_BYTES", 100)
+
+        input_data = FetchStationStatsInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        assert result.stations == []
+        assert result.resource_uri == "resource://mlit/station_stats/stations.json"
+        assert len(json.loads(saved.read_bytes())) == 5
+        assert result.summary == [
+            "Found 5 stations in the area.",
+            "Station list saved as a resource: "
+            "resource://mlit/station_stats/stations.json",
+        ]
+
+        inline = await tool.run(input_data, allow_resource=False)
+
+        assert len(inline.stations) == 5
+        assert inline.resource_uri is None
+
+    @pytest.mark.asyncio
+    async def test_short_station_list_is_not_measured(
+        self, tool, mock_http_client, monkeypatch
+    ):
+        """Lists too short to reach the threshold skip serialization."""
+        mock_http_client.fetch.return_value = MagicMock(
+            data={
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "properties": {"S12_001_ja": "東京駅"},
+                        "geometry": {"coordinates": [139.76, 35.68]},
+                    }
+                ],
+            },
+            file_path=None,
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("short lists should not be serialized")
+
+        monkeypatch.setattr(tool, "_save_if_large", fail)
+
+        input_data = FetchStationStatsInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        assert len(result.stations) == 1
+        assert result.resource_uri is None
+
+    @pytest.mark.asyncio
+    async def test_failed_resource_save_is_reported(
+        self, tool, mock_http_client, monkeypatch
+    ):
+        """Errors while saving the resource end up in the summary."""
+        mock_http_client.fetch.return_value = MagicMock(
+            data={
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "properties": {"S12_001_ja": f"駅{i}"},
+                        "geometry": {"coordinates": [139.7, 35.6]},
+                    }
+                    for i in range(5)
+                ],
+            },
+            file_path=None,
+        )
+
+        def save_to_cache(key, content, suffix):
+            raise OSError("disk full")
+
+        mock_http_client.save_to_cache = save_to_cache
+        monkeypatch.setattr(fetch_station_stats, "RESOURCE_THRESHOLD_BYTES", 100)
+
+        input_data = FetchStationStatsInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        assert result.resource_uri is None
+        assert result.summary[-1] == "Error fetching station data: disk full"
+
+    @pytest.mark.asyncio
+    async def test_invoke_returns_wire_format(self, tool, mock_http_client):
+        """invoke() returns aliased fields with station records unchanged."""
+        feature = {
+            "properties": {"S12_001_ja": "渋谷駅", "S12_002_ja": "JR東日本"},
+            "geometry": {"coordinates": [139.7, 35.66]},
+        }
+        mock_http_client.fetch.return_value = MagicMock(
+            data={"type": "FeatureCollection", "features": [feature]},
+            file_path=None,
+        )
+
+        result = await tool.invoke({"latitude": 35.6812, "longitude": 139.7671})
+
+        assert result["tileCoords"]["z"] == 14
+        assert "resourceUri" not in result
+        assert result["stations"] == [
+            {
+                "station_name": "渋谷駅",
+                "operator": "JR東日本",
+                "line_name": "Unknown",
+                "passenger_count": None,
+                "coordinates": [139.7, 35.66],
+            }
+        ]
+
     @pytest.mark.asyncio
     async def test_api_error_handling(self, tool, mock_http_client):
         """Test handling of API errors."""
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import httpx
 import json
 import pytest
 from unittest.mock import AsyncMock
 from pydantic import ValidationError
 
+from mlit_mcp.cache import BinaryFileCache, InMemoryTTLCache
 from mlit_mcp.http_client import FetchResult, MLITHttpClient
 from mlit_mcp.tools.fetch_transaction_points import (
     BoundingBox,
@@ -230,6 +232,51 @@ class TestFetchTransactionPointsTool:
         assert len(result.geojson["features"]) == 1
         assert result.geojson["features"][0]["geometry"]["coordinates"] == [139.7, 35.7]
 
+    @pytest.mark.anyio
+    async def test_bbox_filtering_keeps_non_point_features_in_order(
+        self, tool, mock_http_client
+    ):
+        """Non-point features are kept in their original position."""
+        polygon = {
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+            "properties": {"id": "polygon"},
+        }
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [141.0, 36.5]},
+                    "properties": {"id": "outside"},
+                },
+                polygon,
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [139.5, 35.5]},
+                    "properties": {"id": "inside"},
+                },
+                {"type": "Feature", "geometry": None, "properties": {"id": "none"}},
+            ],
+        }
+        mock_http_client.fetch.return_value = FetchResult(data=geojson)
+
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": 139.0, "minLat": 35.0, "maxLon": 140.0, "maxLat": 36.0},
+        )
+        result = await tool.run(payload)
+
+        assert [f["properties"]["id"] for f in result.geojson["features"]] == [
+            "polygon",
+            "inside",
+            "none",
+        ]
+
     @pytest.mark.anyio
     async def test_bbox_not_specified(self, tool, mock_http_client, sample_geojson):
         """Test that missing bbox works correctly."""
@@ -400,3 +447,151 @@ class TestFetchTransactionPointsTool:
         assert result.resource_uri is None
         assert result.meta.is_resource is False
         assert result.meta.cache_hit is True
+
+    @pytest.mark.anyio
+    async def test_cached_file_bbox_filtering(
+        self, tool, mock_http_client, sample_geojson, tmp_path
+    ):
+        """Test bbox filtering while loading GeoJSON from a cached file."""
+        geojson_file = tmp_path / "cached.geojson"
+        geojson_file.write_text(json.dumps(sample_geojson))
+
+        mock_http_client.fetch.return_value = FetchResult(
+            data=None,
+            file_path=geojson_file,
+            from_cache=True,
+        )
+
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": 139.0, "minLat": 35.0, "maxLon": 139.75, "maxLat": 35.75},
+        )
+        result = await tool.run(payload)
+
+        assert result.geojson["type"] == "FeatureCollection"
+        assert [f["properties"]["price"] for f in result.geojson["features"]] == [
+            50000000
+        ]
+
+    @pytest.mark.anyio
+    async def test_large_file_with_bbox_is_not_parsed(
+        self, tool, mock_http_client, tmp_path, monkeypatch
+    ):
+        """Large files are returned as a resource without loading them."""
+        geojson_file = tmp_path / "large.geojson"
+        geojson_file.write_bytes(b"x" * (RESOURCE_THRESHOLD_BYTES + 1))
+
+        mock_http_client.fetch.return_value = FetchResult(
+            data=None,
+            file_path=geojson_file,
+            from_cache=True,
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("large file should not be parsed")
+
+        monkeypatch.setattr(tool, "_filter_by_bbox", fail)
+        monkeypatch.setattr(tool, "_load_geojson", fail)
+
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": 139.0, "minLat": 35.0, "maxLon": 139.75, "maxLat": 35.75},
+        )
+        result = await tool.run(payload)
+
+        assert result.geojson is None
+        assert result.resource_uri.endswith(geojson_file.name)
+        assert result.meta.size_bytes == RESOURCE_THRESHOLD_BYTES + 1
+
+    @pytest.mark.anyio
+    async def test_bbox_covering_tile_skips_filtering(
+        self, tool, mock_http_client, sample_geojson, monkeypatch
+    ):
+        """A bbox containing the whole tile needs no per-feature filtering."""
+        mock_http_client.fetch.return_value = FetchResult(
+            data=sample_geojson,
+            from_cache=False,
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("bbox filter should be skipped")
+
+        monkeypatch.setattr(tool, "_filter_by_bbox", fail)
+
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": -180, "minLat": -90, "maxLon": 180, "maxLat": 90},
+        )
+        result = await tool.run(payload)
+
+        assert result.geojson["features"] == sample_geojson["features"]
+
+    @pytest.mark.anyio
+    async def test_real_client_filters_downloaded_tile(
+        self, monkeypatch, tmp_path, sample_geojson
+    ):
+        """XPT001 tiles fetched through the client are filtered from the file."""
+        monkeypatch.setenv("MLIT_API_KEY", "dummy")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=json.dumps(sample_geojson).encode())
+
+        client = MLITHttpClient(
+            base_url="https://example.test/",
+            json_cache=InMemoryTTLCache(maxsize=4, ttl=60),
+            file_cache=BinaryFileCache(tmp_path / "bin"),
+            transport=httpx.MockTransport(handler),
+        )
+        tool = FetchTransactionPointsTool(http_client=client)
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": 139.0, "minLat": 35.0, "maxLon": 139.75, "maxLat": 35.75},
+        )
+
+        fresh = await tool.run(payload)
+        cached = await tool.run(payload)
+
+        for result in (fresh, cached):
+            assert [f["properties"]["price"] for f in result.geojson["features"]] == [
+                50000000
+            ]
+        assert cached.meta.cache_hit is True
+
+    @pytest.mark.anyio
+    async def test_bbox_filter_leaves_caller_data_untouched(
+        self, tool, mock_http_client, sample_geojson
+    ):
+        """Filtering already-parsed data does not mutate the caller's mapping."""
+        mock_http_client.fetch.return_value = FetchResult(
+            data=sample_geojson,
+            from_cache=False,
+        )
+
+        payload = FetchTransactionPointsInput(
+            z=13,
+            x=7312,
+            y=3008,
+            fromQuarter="20231",
+            toQuarter="20244",
+            bbox={"minLon": 139.0, "minLat": 35.0, "maxLon": 139.75, "maxLat": 35.75},
+        )
+        result = await tool.run(payload)
+
+        assert len(result.geojson["features"]) == 1
+        assert len(sample_geojson["features"]) == 2
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from mlit_mcp.tools.fetch_transactions import (
@@ -124,3 +126,102 @@ async def test_fetch_transactions_large_response(mock_http_client):
 
     finally:
         mod.RESOURCE_THRESHOLD_BYTES = original_threshold
+
+
+@pytest.mark.asyncio
+async def test_fetch_transactions_fetches_years_concurrently(mock_http_client):
+    in_flight = 0
+    peak = 0
+
+    async def fetch(endpoint, *, params, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later years finish first; results must still come back in year order
+        await asyncio.sleep((2020 - int(params["year"])) * 0.01)
+        in_flight -= 1
+        return FetchResult(data={"data": [{"year": params["year"]}]})
+
+    mock_http_client.fetch.side_effect = fetch
+    tool = FetchTransactionsTool(mock_http_client)
+    input_data = FetchTransactionsInput(fromYear=2018, toYear=2020, area="13")
+
+    result = await tool.run(input_data)
+
+    assert peak == 3
+    assert [r["year"] for r in result.data] == ["2018", "2019", "2020"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_transactions_resource_content_matches_merged_years(
+    mock_http_client, monkeypatch
+):
+    import json
+    from pathlib import Path
+
+    import mlit_mcp.tools.fetch_transactions as mod
+    from mlit_mcp import json_codec
+
+    years = {
+        "2019": {"data": [{"id": 1, "name": "東京"}]},
+        "2020": {"data": []},
+        "2021": [{"id": 2}, {"id": 3}],
+    }
+
+    async def fetch(endpoint, *, params, **kwargs):
+        return FetchResult(data=years[params["year"]])
+
+    mock_http_client.fetch.side_effect = fetch
+    mock_http_client.save_to_cache.return_value = Path("/tmp/cache/merged.json")
+    monkeypatch.setattr(mod, "RESOURCE_THRESHOLD_BYTES", 10)
+
+    tool = FetchTransactionsTool(mock_http_client)
+    input_data = FetchTransactionsInput(fromYear=2019, toYear=2021, area="13")
+    await tool.run(input_data)
+
+    content = mock_http_client.save_to_cache.call_args[0][1]
+    assert json.loads(content) == [{"id": 1, "name": "東京"}, {"id": 2}, {"id": 3}]
+    assert content == json_codec.dumps(json.loads(content))
+
+
+def test_fetch_transactions_descriptor_reuses_schemas(mock_http_client):
+    first = FetchTransactionsTool(mock_http_client).descriptor()
+    second = FetchTransactionsTool(mock_http_client).descriptor()
+    assert second["inputSchema"] is first["inputSchema"]
+    assert second["outputSchema"] is first["outputSchema"]
+    assert first["inputSchema"] == FetchTransactionsInput.model_json_schema()
+
+
+@pytest.mark.parametrize(
+    "year_data, expected",
+    [
+        ({"status": "OK", "data": [{"id": 1}]}, [{"id": 1}]),
+        ({"status": "OK"}, []),
+        ({"id": 1}, [{"id": 1}]),
+        ([{"id": 1}], [{"id": 1}]),
+        (None, []),
+    ],
+)
+def test_extract_records_shapes(year_data, expected):
+    from mlit_mcp.tools.fetch_transactions import _extract_records
+
+    assert _extract_records(year_data) == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_transactions_invoke_passes_records_through(mock_http_client):
+    records = [{"Type": "宅地(土地)", "TradePrice": "1000000"}]
+    mock_http_client.fetch.return_value = FetchResult(data={"data": records})
+    tool = FetchTransactionsTool(mock_http_client)
+
+    result = await tool.invoke({"fromYear": 2020, "toYear": 2020, "area": "13"})
+
+    assert result["data"] == records
+    assert result["data"][0] is records[0]
+    assert "resourceUri" not in result
+    assert result["meta"] == {
+        "dataset": "XIT001",
+        "source": "reinfolib.mlit.go.jp",
+        "cacheHit": False,
+        "format": "json",
+    }
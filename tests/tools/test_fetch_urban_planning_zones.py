@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import pytest
+import asyncio
+import base64
 import json
 from unittest.mock import AsyncMock
 from pydantic import ValidationError
@@ -10,7 +12,11 @@ from mlit_mcp.tools.fetch_urban_planning_zones import (
     FetchUrbanPlanningZonesInput,
     FetchUrbanPlanningZonesTool,
 )
-from mlit_mcp.tools.gis_helpers import decode_base64_to_mvt
+from mlit_mcp.tools.gis_helpers import (
+    decode_base64_to_mvt,
+    encode_file_to_base64,
+    encode_mvt_to_base64,
+)
 
 
 @pytest.fixture
@@ -132,6 +138,83 @@ class TestFetchUrbanPlanningZonesTool:
         decoded = decode_base64_to_mvt(result.pbf_base64)
         assert decoded == pbf_content
 
+    @pytest.mark.anyio
+    async def test_pbf_format_above_inline_encode_limit(
+        self, tool, mock_http_client, tmp_path
+    ):
+        """Tiles encoded on a worker thread decode to the original bytes."""
+        pbf_content = bytes(range(256)) * 400  # 100 KB, under the resource limit
+        pbf_file = tmp_path / "big.pbf"
+        pbf_file.write_bytes(pbf_content)
+
+        mock_http_client.fetch.return_value = FetchResult(
+            data=None,
+            file_path=pbf_file,
+            from_cache=True,
+        )
+
+        payload = FetchUrbanPlanningZonesInput(
+            z=11,
+            x=1819,
+            y=806,
+            responseFormat="pbf",
+        )
+        result = await tool.run(payload)
+
+        assert result.meta.is_resource is False
+        assert decode_base64_to_mvt(result.pbf_base64) == pbf_content
+
+    @pytest.mark.asyncio
+    async def test_prefetch_neighbors(self, tool, mock_http_client, sample_geojson):
+        """Neighboring tiles are fetched in the background when requested."""
+        mock_http_client.fetch.return_value = FetchResult(
+            data=sample_geojson,
+            file_path=None,
+            from_cache=False,
+        )
+
+        payload = FetchUrbanPlanningZonesInput(z=11, x=0, y=806, prefetchNeighbors=True)
+        result = await tool.run(payload)
+        await asyncio.gather(*tool._prefetch_tasks)
+
+        assert result.geojson == sample_geojson
+        fetched = {
+            (c.kwargs["params"]["x"], c.kwargs["params"]["y"])
+            for c in mock_http_client.fetch.call_args_list
+        }
+        # x=0 sits on the tile grid's western edge, so only 5 neighbors exist
+        assert fetched == {(x, y) for x in (0, 1) for y in (805, 806, 807)}
+        assert not tool._prefetch_tasks
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fetches_one_tile_at_a_time(
+        self, tool, mock_http_client, sample_geojson
+    ):
+        """The prefetch never holds more than one of the client's slots."""
+        in_flight = 0
+        peak = 0
+
+        async def fetch(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if kwargs["params"]["x"] == 101:
+                raise RuntimeError("boom")
+            return FetchResult(data=sample_geojson, file_path=None, from_cache=False)
+
+        mock_http_client.fetch.side_effect = fetch
+
+        payload = FetchUrbanPlanningZonesInput(
+            z=11, x=100, y=806, prefetchNeighbors=True
+        )
+        await tool.run(payload)
+        await asyncio.gather(*tool._prefetch_tasks)
+
+        assert mock_http_client.fetch.call_count == 9
+        assert peak == 1
+
     @pytest.mark.anyio
     async def test_large_response_resource_uri(self, tool, mock_http_client, tmp_path):
         """Test that large responses return a resource URI."""
@@ -188,3 +271,33 @@ class TestFetchUrbanPlanningZonesTool:
         assert result.resource_uri is None
         assert result.meta.is_resource is False
         assert result.meta.cache_hit is True
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 10, 1000])
+@pytest.mark.parametrize("chunk_size", [3, 6, 3 * 64 * 1024])
+def test_encode_file_to_base64_matches_whole_file_encoding(tmp_path, size, chunk_size):
+    content = bytes(i % 251 for i in range(size))
+    path = tmp_path / "tile.pbf"
+    path.write_bytes(content)
+
+    encoded = encode_file_to_base64(path, chunk_size=chunk_size)
+
+    assert decode_base64_to_mvt(encoded) == content
+    assert len(encoded) == -(-size // 3) * 4
+
+
+def test_encode_file_to_base64_rejects_unaligned_chunks(tmp_path):
+    path = tmp_path / "tile.pbf"
+    path.write_bytes(b"abc")
+    with pytest.raises(ValueError):
+        encode_file_to_base64(path, chunk_size=4)
+
+
+@pytest.mark.parametrize("size", [0, 1, 95, 96, 1000])
+def test_encode_mvt_to_base64_round_trips(size):
+    content = bytes(i % 251 for i in range(size))
+
+    encoded = encode_mvt_to_base64(content)
+
+    assert encoded == base64.b64encode(content).decode("ascii")
+    assert decode_base64_to_mvt(encoded) == content
@@ -57,8 +57,100 @@ class TestGenerateAreaReportTool:
         assert result.latitude == 35.6812
         assert "report" in dir(result)
 
+    @pytest.mark.asyncio
+    async def test_sections_keep_order_when_one_fails(self, tool, mock_http_client):
+        """A failing section is reported in place; the others still render."""
+        mock_http_client.fetch.return_value = MagicMock(
+            data={"type": "FeatureCollection", "features": []},
+            file_path=None,
+        )
+        tool._amenity_section = AsyncMock(side_effect=RuntimeError("boom"))
+
+        input_data = GenerateAreaReportInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        headings = [
+            line for line in result.report.splitlines() if line.startswith("## ")
+        ]
+        assert headings == [
+            "## Safety Information",
+            "## Nearby Amenities",
+            "## Population Trends",
+            "## Station Access",
+        ]
+        assert "*Data unavailable: boom*" in result.report
+        assert set(result.sections) == {"safety", "population", "stations"}
+
+    @pytest.mark.asyncio
+    async def test_invoke_returns_plain_dict(self, tool, mock_http_client):
+        """invoke() output matches a full model_dump of the response."""
+        mock_http_client.fetch.return_value = MagicMock(
+            data={"type": "FeatureCollection", "features": []},
+            file_path=None,
+        )
+
+        result = await tool.invoke({"latitude": 35.6812, "longitude": 139.7671})
+
+        assert result["latitude"] == 35.6812
+        assert result["report"].startswith("# Area Analysis Report")
+        assert set(result["sections"]) == {
+            "safety",
+            "amenities",
+            "population",
+            "stations",
+        }
+        assert result == GenerateAreaReportResponse(**result).model_dump(
+            by_alias=True, exclude_none=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_station_section_lists_stations_over_threshold(
+        self, tool, mock_http_client, monkeypatch
+    ):
+        """The report keeps the station list even when it would spill."""
+        from mlit_mcp.tools import fetch_station_stats
+
+        mock_http_client.fetch.return_value = MagicMock(
+            data={
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "properties": {"S12_001_ja": f"駅{i}"},
+                        "geometry": {"coordinates": [139.7, 35.6]},
+                    }
+                    for i in range(3)
+                ],
+            },
+            file_path=None,
+        )
+        monkeypatch.setattr(fetch_station_stats, "RESOURCE_THRESHOLD_BYTES", 10)
+
+        input_data = GenerateAreaReportInput(latitude=35.6812, longitude=139.7671)
+        result = await tool.run(input_data)
+
+        assert result.sections["stations"]["station_count"] == 3
+        assert "### Nearby Stations" in result.report
+        mock_http_client.save_to_cache.assert_not_called()
+
     def test_descriptor(self, tool):
         """Test tool descriptor."""
         descriptor = tool.descriptor()
         assert descriptor["name"] == "mlit.generate_area_report"
         assert "description" in descriptor
+
+
+@pytest.mark.asyncio
+async def test_sub_tools_are_reused_across_reports(tool, mock_http_client):
+    """Sub-tools are created once per report tool, not once per run."""
+    mock_http_client.fetch.return_value = MagicMock(
+        data={"type": "FeatureCollection", "features": []},
+        file_path=None,
+    )
+    safety_tool = tool._safety_tool
+    input_data = GenerateAreaReportInput(latitude=35.6812, longitude=139.7671)
+
+    await tool.run(input_data)
+    await tool.run(input_data)
+
+    assert tool._safety_tool is safety_tool
+    assert safety_tool._http_client is mock_http_client
@@ -131,3 +131,178 @@ async def test_get_price_distribution_empty(tool, mock_http_client):
 
     assert result.total_count == 0
     assert len(result.bins) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_fetches_years_concurrently(
+    tool, mock_http_client
+):
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def fetch(endpoint, *, params, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        price = (int(params["year"]) - 2017) * 10000000
+        return FetchResult(data={"data": [{"TradePrice": str(price)}]})
+
+    mock_http_client.fetch.side_effect = fetch
+    input_data = GetPriceDistributionInput(
+        fromYear=2018,
+        toYear=2020,
+        area="13103",
+        numBins=3,
+    )
+
+    result = await tool.run(input_data)
+
+    assert peak == 3
+    assert result.total_count == 3
+    assert result.min_price == 10000000
+    assert result.max_price == 30000000
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_matches_statistics_quantiles(
+    tool, mock_http_client
+):
+    from statistics import median, quantiles
+
+    prices = [3100000, 18000000, 2500000, 77000000, 42000000, 9900000, 15000000]
+    mock_data = [{"TradePrice": str(p)} for p in prices]
+    # Unparseable or missing prices are skipped
+    mock_data += [{"TradePrice": "n/a"}, {"TradePrice": ""}, {}]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    input_data = GetPriceDistributionInput(
+        fromYear=2020,
+        toYear=2020,
+        area="13103",
+        numBins=4,
+    )
+
+    result = await tool.run(input_data)
+
+    q = quantiles(sorted(prices), n=4)
+    assert result.total_count == len(prices)
+    assert result.percentile_25 == int(q[0])
+    assert result.percentile_50 == int(median(prices))
+    assert result.percentile_75 == int(q[2])
+
+    price_range = max(prices) - min(prices)
+    expected = [0] * 4
+    for price in prices:
+        expected[min((price - min(prices)) * 4 // price_range, 3)] += 1
+    assert [b.count for b in result.bins] == expected
+
+
+def test_get_price_distribution_descriptor_reuses_schemas(mock_http_client):
+    first = GetPriceDistributionTool(mock_http_client).descriptor()
+    second = GetPriceDistributionTool(mock_http_client).descriptor()
+    assert second["inputSchema"] is first["inputSchema"]
+    assert second["outputSchema"] is first["outputSchema"]
+    assert first["inputSchema"] == GetPriceDistributionInput.model_json_schema()
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_invoke_bins(tool, mock_http_client):
+    mock_data = [{"TradePrice": str(p)} for p in (12000000, 27000000, 35000000)]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    result = await tool.invoke(
+        {"fromYear": 2020, "toYear": 2020, "area": "13103", "numBins": 3}
+    )
+
+    assert result["bins"] == [
+        {
+            "minValue": 12000000,
+            "maxValue": 19666666,
+            "label": "1200万〜1966万",
+            "count": 1,
+            "cumulativePercent": 33.3,
+        },
+        {
+            "minValue": 19666666,
+            "maxValue": 27333333,
+            "label": "1966万〜2733万",
+            "count": 1,
+            "cumulativePercent": 66.7,
+        },
+        {
+            "minValue": 27333333,
+            "maxValue": 35000000,
+            "label": "2733万〜3500万",
+            "count": 1,
+            "cumulativePercent": 100.0,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_invoke_empty(tool, mock_http_client):
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": []}, from_cache=False
+    )
+
+    result = await tool.invoke({"fromYear": 2020, "toYear": 2020, "area": "13"})
+
+    assert result == {"totalCount": 0, "bins": []}
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_price_on_edge_starts_bin(tool, mock_http_client):
+    # Range 18 over 14 bins: 1000009 sits exactly on the lower edge of bin 7,
+    # where float division (9 / (18 / 14)) rounds down to 6.
+    mock_data = [{"TradePrice": str(p)} for p in (1000000, 1000009, 1000018)]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    input_data = GetPriceDistributionInput(
+        fromYear=2020,
+        toYear=2020,
+        area="13103",
+        numBins=14,
+    )
+
+    result = await tool.run(input_data)
+
+    assert result.bins[7].min_value == 1000009
+    assert result.bins[7].count == 1
+    assert result.bins[6].count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_price_distribution_skips_unparseable_prices(tool, mock_http_client):
+    """Malformed prices and prices beyond int64 are skipped, not fatal."""
+    mock_data = [
+        {"TradePrice": "10000000"},
+        {"TradePrice": "n/a"},
+        {"TradePrice": str(2**63)},
+        {"TradePrice": "30000000"},
+    ]
+    mock_http_client.fetch.return_value = FetchResult(
+        data={"data": mock_data}, from_cache=False
+    )
+
+    input_data = GetPriceDistributionInput(
+        fromYear=2020,
+        toYear=2020,
+        area="13103",
+        numBins=2,
+    )
+
+    result = await tool.run(input_data)
+
+    assert result.total_count == 2
+    assert result.min_price == 10000000
+    assert result.max_price == 30000000
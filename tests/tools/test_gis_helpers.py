@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mlit_mcp.tools.gis_helpers import (
+    bbox_to_tiles,
+    bbox_to_tiles_array,
+    lat_lon_to_tile,
+    lat_lon_to_tile_batch,
+    read_tile_file,
+)
+
+
+@pytest.mark.parametrize(
+    "bbox, zoom",
+    [
+        ((35.60, 139.65, 35.75, 139.85), 14),
+        ((35.6812, 139.7671, 35.6812, 139.7671), 15),
+        ((34.0, 135.0, 36.0, 140.0), 11),
+    ],
+)
+def test_bbox_to_tiles_covers_bbox_in_x_major_order(bbox, zoom):
+    min_lat, min_lon, max_lat, max_lon = bbox
+    min_x, max_y = lat_lon_to_tile(min_lat, min_lon, zoom)
+    max_x, min_y = lat_lon_to_tile(max_lat, max_lon, zoom)
+    expected = [
+        (x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)
+    ]
+
+    tiles = bbox_to_tiles(*bbox, zoom)
+    array = bbox_to_tiles_array(*bbox, zoom)
+
+    assert tiles == expected
+    assert array.dtype == np.int32
+    assert array.shape == (len(expected), 2)
+    assert [tuple(row) for row in array.tolist()] == expected
+
+
+@pytest.mark.parametrize("zoom", [11, 14, 15])
+def test_lat_lon_to_tile_batch_matches_scalar(zoom):
+    lats = [35.6812, 34.7025, 43.0686, 26.2124]
+    lons = [139.7671, 135.4959, 141.3508, 127.6792]
+
+    tile_x, tile_y = lat_lon_to_tile_batch(lats, lons, zoom)
+
+    assert tile_x.dtype == np.int32
+    assert list(zip(tile_x.tolist(), tile_y.tolist())) == [
+        lat_lon_to_tile(lat, lon, zoom) for lat, lon in zip(lats, lons)
+    ]
+
+
+def test_read_tile_file_returns_content_only_when_wanted_and_small(tmp_path):
+    path = tmp_path / "tile.geojson"
+    path.write_bytes(b"0123456789")
+
+    assert read_tile_file(path, True, 10) == (10, b"0123456789")
+    assert read_tile_file(path, True, 9) == (10, None)
+    assert read_tile_file(path, False, 10) == (10, None)
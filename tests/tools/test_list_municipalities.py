@@ -93,3 +93,23 @@ async def test_force_refresh_bypasses_cache(http_client):
     payload_force = ListMunicipalitiesInput(prefecture_code="13", force_refresh=True)
     await tool.run(payload_force)
     assert http_client._call_count["count"] == 2
+
+
+def test_transform_records_skips_invalid_codes():
+    from mlit_mcp.http_client import FetchResult
+    from mlit_mcp.tools.list_municipalities import ListMunicipalitiesTool
+
+    tool = ListMunicipalitiesTool(http_client=None)  # type: ignore[arg-type]
+    records = [
+        {"id": 13101, "name": "千代田区"},
+        {"id": "131", "name": "短いコード"},
+        {"id": "1310200", "name": "長いコード"},
+        {"id": "13103", "name": ""},
+        "not a record",
+    ]
+
+    municipalities = tool._transform_records(FetchResult(data={"data": records}))
+
+    assert [m.model_dump() for m in municipalities] == [
+        {"code": "13101", "name": "千代田区"}
+    ]
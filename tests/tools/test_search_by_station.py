@@ -1,8 +1,12 @@
 """Tests for search_by_station tool."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from mlit_mcp.http_client import FetchResult
+
 from mlit_mcp.tools.search_by_station import (
     SearchByStationInput,
     SearchByStationResponse,
@@ -115,6 +119,83 @@ class TestSearchByStationTool:
         assert isinstance(result, SearchByStationResponse)
         assert "not found" in " ".join(result.summary).lower()
 
+    @pytest.mark.asyncio
+    async def test_station_found_in_cached_tile_file(
+        self, tool, mock_http_client, tmp_path
+    ):
+        """Cached tile files are parsed and scanned for the station."""
+        tile = tmp_path / "tile.geojson"
+        tile.write_text(
+            json.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "properties": {"S12_001_ja": "新宿"},
+                            "geometry": {"coordinates": [139.70, 35.69]},
+                        },
+                        {
+                            "properties": {"S12_001_ja": "東京"},
+                            "geometry": {"coordinates": [139.77, 35.68]},
+                        },
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        mock_http_client.fetch.side_effect = [
+            FetchResult(file_path=tile, from_cache=True),
+            FetchResult(data={"status": "OK", "data": [{"id": 1}]}),
+        ]
+
+        input_data = SearchByStationInput(stationName="東京")
+        result = await tool.run(input_data)
+
+        assert result.station_coords == [139.77, 35.68]
+        assert result.summary[0] == "Found station: 東京"
+        assert result.transactions == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_neighbor_tiles_fetched_concurrently_in_scan_order(
+        self, tool, mock_http_client
+    ):
+        """Neighbor tiles are fetched together; the first in scan order wins."""
+        import asyncio
+
+        from mlit_mcp.tools.gis_helpers import lat_lon_to_tile
+
+        x, y = lat_lon_to_tile(35.6812, 139.7671, 12)
+        in_flight = 0
+        peak = 0
+
+        def station(name):
+            return {
+                "properties": {"S12_001_ja": name},
+                "geometry": {"coordinates": [139.7, 35.6]},
+            }
+
+        # (-1, 0) comes before (1, 1) in scan order but finishes last
+        tiles = {(x - 1, y): ("東京A", 0.05), (x + 1, y + 1): ("東京B", 0.0)}
+
+        async def fetch(endpoint, *, params, **kwargs):
+            nonlocal in_flight, peak
+            if endpoint == "XIT001":
+                return FetchResult(data={"status": "OK", "data": []})
+            in_flight += 1
+            peak = max(peak, in_flight)
+            name, delay = tiles.get((params["x"], params["y"]), (None, 0.01))
+            await asyncio.sleep(delay)
+            in_flight -= 1
+            features = [station(name)] if name else []
+            return FetchResult(data={"features": features})
+
+        mock_http_client.fetch.side_effect = fetch
+
+        result = await tool.run(SearchByStationInput(stationName="東京"))
+
+        assert peak == 8
+        assert result.summary[0] == "Found station: 東京A"
+
     def test_descriptor(self, tool):
         """Test tool descriptor."""
         descriptor = tool.descriptor()
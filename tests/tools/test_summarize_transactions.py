@@ -113,3 +113,55 @@ async def test_summarize_transactions_price_by_year(mock_http_client):
     assert "2021" in result.price_by_year
     assert result.price_by_year["2020"] == 110000000  # (100M + 120M) / 2
     assert result.price_by_year["2021"] == 200000000
+
+
+@pytest.mark.asyncio
+async def test_summarize_transactions_fetches_years_concurrently(mock_http_client):
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def fetch(endpoint, *, params, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return FetchResult(
+            data={"data": [{"TradePrice": "10000000", "Period": params["year"]}]}
+        )
+
+    mock_http_client.fetch.side_effect = fetch
+    tool = SummarizeTransactionsTool(mock_http_client)
+    input_data = SummarizeTransactionsInput(from_year=2018, to_year=2020, area="13")
+
+    result = await tool.run(input_data)
+
+    assert peak == 3
+    assert result.record_count == 3
+
+
+@pytest.mark.asyncio
+async def test_summarize_transactions_skips_failed_years(mock_http_client):
+    mock_http_client.fetch.side_effect = [
+        FetchResult(data={"data": [{"TradePrice": "10000000"}]}, from_cache=True),
+        RuntimeError("upstream error"),
+    ]
+    tool = SummarizeTransactionsTool(mock_http_client)
+    input_data = SummarizeTransactionsInput(from_year=2020, to_year=2021, area="13")
+
+    result = await tool.run(input_data)
+
+    assert result.record_count == 1
+    assert result.meta.cache_hit is True
+
+
+@pytest.mark.asyncio
+async def test_summarize_transactions_raises_when_every_year_fails(mock_http_client):
+    mock_http_client.fetch.side_effect = RuntimeError("upstream error")
+    tool = SummarizeTransactionsTool(mock_http_client)
+    input_data = SummarizeTransactionsInput(from_year=2020, to_year=2021, area="13")
+
+    with pytest.raises(RuntimeError, match="upstream error"):
+        await tool.run(input_data)